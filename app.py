@@ -4,8 +4,33 @@ A vibrant, modern e-commerce application with advanced features.
 """
 
 import streamlit as st
+from streamlit.runtime import Runtime
 from datetime import datetime
-import random
+import os
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+from vibecart.assets import build_asset, minify_css
+from vibecart.cache import VersionedCache
+from vibecart.cart import Cart
+from vibecart.cards import CardRenderer, category_css
+from vibecart.columns import ColumnarCatalog
+from vibecart.events import DEFAULT_EVENTS_PATH, EventLog
+from vibecart.exports import FORMATS, export_catalog, export_orders, file_name, mime_type
+from vibecart.facets import FacetIndex
+from vibecart.ids import IdGenerator
+from vibecart.images import DEFAULT_THUMB_DIR, ImageStore
+from vibecart.inventory import Inventory, OutOfStock
+from vibecart.orders import DEFAULT_ORDERS_DB_PATH, OrderStore
+from vibecart.pricing import PROMO_RULES, PricingEngine
+from vibecart.profiling import Profiler
+from vibecart.recommend import Recommender
+from vibecart.search import SearchIndex
+from vibecart.session import SESSION_BYTES_BUDGET, RecentlyViewed, Wishlist, deep_sizeof, session_footprint
+from vibecart.seed import DEFAULT_DB_PATH, open_catalog, seed
 
 # Page Configuration
 st.set_page_config(
@@ -34,9 +59,22 @@ COLORS = {
     "orange": "#F8961E"      # Orange
 }
 
+# Category badge colors
+CATEGORY_COLORS = {
+    "Electronics": COLORS["info"],
+    "Clothing": COLORS["warning"],
+    "Footwear": COLORS["primary"],
+    "Accessories": COLORS["purple"],
+    "Fitness": COLORS["success"],
+    "Home": COLORS["accent"],
+    "Beauty": COLORS["orange"],
+    "Art": COLORS["secondary"]
+}
+
 # Custom CSS with Vibrant Theme
-st.markdown(f"""
-<style>
+def build_stylesheet():
+    """Format the theme CSS - called once per process by load_static_assets"""
+    return f"""
     /* Main styling with gradient background */
     .stApp {{
         background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
@@ -99,6 +137,24 @@ st.markdown(f"""
         box-shadow: 0 20px 40px rgba(0,0,0,0.15);
     }}
     
+    .product-image {{
+        display: block;
+        width: 100%;
+        height: auto;
+        aspect-ratio: 1;
+        object-fit: cover;
+        border-radius: 15px;
+        margin-bottom: 1rem;
+    }}
+    
+    .product-detail-image {{
+        display: block;
+        max-width: 100%;
+        height: auto;
+        border-radius: 10px;
+        margin-bottom: 0.75rem;
+    }}
+    
     .product-emoji {{
         font-size: 3rem;
         text-align: center;
@@ -340,240 +396,400 @@ st.markdown(f"""
         0% {{ transform: translate(0, 0); }}
         100% {{ transform: translate(24px, 0); }}
     }}
-</style>
-""", unsafe_allow_html=True)
+    /* Product card body - rendered as one block by vibecart.cards */
+    .card-row {{
+        display: flex;
+        justify-content: space-between;
+        align-items: flex-start;
+        gap: 0.5rem;
+        margin: 0.3rem 0;
+    }}
+    .product-tags {{
+        display: flex;
+        flex-wrap: wrap;
+        gap: 4px;
+    }}
+    .product-tag {{
+        background: {COLORS['info']}20;
+        color: {COLORS['info']};
+        padding: 2px 8px;
+        border-radius: 10px;
+        font-size: 0.7rem;
+    }}
+    .product-category {{
+        background: {COLORS['dark']};
+    }}
+    .original-price {{
+        text-decoration: line-through;
+        color: #999;
+        font-size: 0.9rem;
+    }}
+    .stock {{
+        font-size: 0.9rem;
+        margin: 5px 0;
+    }}
+    .stock-high {{ color: {COLORS['success']}; }}
+    .stock-low {{ color: {COLORS['warning']}; }}
+    .stock-out {{ color: {COLORS['dark']}; }}
+    .rating-bar {{
+        background: {COLORS['light']};
+        border-radius: 10px;
+        height: 8px;
+        overflow: hidden;
+    }}
+    .rating-bar div {{
+        background: linear-gradient(90deg, {COLORS['primary']}, {COLORS['purple']});
+        height: 100%;
+    }}
+    .rating-bar-label {{
+        font-size: 0.8rem;
+        margin: 0.2rem 0 0.8rem 0;
+    }}
+    .review {{
+        border-bottom: 1px solid #eee;
+        padding: 0.5rem 0;
+    }}
+    .review-comment {{
+        color: #666;
+        font-size: 0.85rem;
+    }}
+    
+    /* Collections strip */
+    .collections-grid {{
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }}
+    .collection-card {{
+        padding: 2rem;
+        border-radius: 15px;
+        color: white;
+        text-align: center;
+        height: 150px;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+        cursor: pointer;
+        transition: transform 0.3s;
+    }}
+    .collection-card:hover {{
+        transform: scale(1.05);
+    }}
+    
+    /* Promo codes */
+    .promo-code {{
+        font-family: monospace;
+        background: {COLORS['light']};
+        border-left: 4px solid {COLORS['accent']};
+        border-radius: 6px;
+        padding: 0.5rem 0.75rem;
+        margin: 0.4rem 0;
+    }}
+"""
+
+def build_footer_html():
+    """Footer markup"""
+    return """
+    <div class='footer'>
+        <div style='display: grid; grid-template-columns: repeat(4, 1fr); gap: 2rem;'>
+            <div>
+                <h3 style='color: white;'>🌈 VibeCart</h3>
+                <p>Your colorful shopping destination</p>
+                <p>Making shopping vibrant since 2024</p>
+            </div>
+            <div>
+                <h4 style='color: white;'>Quick Links</h4>
+                <p>🎯 New Arrivals</p>
+                <p>🔥 Best Sellers</p>
+                <p>💖 Wishlist</p>
+                <p>🛍️ Collections</p>
+            </div>
+            <div>
+                <h4 style='color: white;'>Support</h4>
+                <p>📞 1-800-COLORFUL</p>
+                <p>✉️ help@vibecart.com</p>
+                <p>📍 Color Street 123</p>
+                <p>🕒 24/7 Support</p>
+            </div>
+            <div>
+                <h4 style='color: white;'>Stay Colorful</h4>
+                <p>📱 Follow us on Instagram</p>
+                <p>🐦 Tweet with #VibeCart</p>
+                <p>📧 Subscribe for colorful deals</p>
+                <p>⭐ Rate us 5 stars</p>
+            </div>
+        </div>
+        <hr style='border-color: rgba(255,255,255,0.2); margin: 2rem 0;'>
+        <div style='text-align: center; color: rgba(255,255,255,0.8);'>
+            <p>© 2024 VibeCart. All rights reserved. | Made with ❤️ and 🌈 | This is a demo e-commerce application.</p>
+        </div>
+    </div>
+    """
+
+COLLECTIONS = [
+    {"name": "Rainbow Collection", "emoji": "🌈", "color": COLORS["primary"]},
+    {"name": "Pastel Dreams", "emoji": "🌸", "color": COLORS["purple"]},
+    {"name": "Neon Nights", "emoji": "🌃", "color": COLORS["warning"]},
+    {"name": "Gradient Glow", "emoji": "🎆", "color": COLORS["secondary"]}
+]
+
+def build_collections_html():
+    """Featured collections strip as a single block"""
+    cards = "".join(f"""
+        <div class='collection-card' style='background: linear-gradient(135deg, {collection['color']}, {collection['color']}80);'>
+            <div style='font-size: 2.5rem; margin-bottom: 0.5rem;'>{collection['emoji']}</div>
+            <h3 style='margin: 0;'>{collection['name']}</h3>
+            <p style='margin: 0; opacity: 0.9;'>Explore →</p>
+        </div>
+    """ for collection in COLLECTIONS)
+    return f"<div class='collections-grid'>{cards}</div>"
+
+def build_promo_html():
+    """Promo code list for the sidebar expander"""
+    return "".join(f"<div class='promo-code'>{rule.code} - {rule.description}</div>" for rule in PROMO_RULES)
+
+@st.cache_resource
+def load_profiler():
+    """Per-function timing histograms for the process - VIBECART_PROFILE=1 starts it on"""
+    return Profiler()
+
+PROFILER = load_profiler()
+
+# Admin tools show with VIBECART_ADMIN=1, or ?admin=<VIBECART_ADMIN_TOKEN> when a token is set
+ADMIN_TOKEN = os.environ.get("VIBECART_ADMIN_TOKEN")
+
+@st.cache_resource
+def load_static_assets():
+    """Render, minify and content-hash the static page chrome once per process"""
+    return {
+        "styles": build_asset("styles", build_stylesheet() + category_css(CATEGORY_COLORS), minify_css),
+        "footer": build_asset("footer", build_footer_html()),
+        "collections": build_asset("collections", build_collections_html()),
+        "promo_codes": build_asset("promo_codes", build_promo_html())
+    }
+
+STATIC_ASSETS = load_static_assets()
+
+# The stylesheet goes to the event container, so it takes no layout space, and
+# is byte-identical on every rerun so the browser message cache can serve it
+styles = STATIC_ASSETS["styles"]
+st.html(f'<style data-asset="{styles.name}-{styles.digest}">{styles.content}</style>')
 
 # Initialize session state
 if 'cart' not in st.session_state:
-    st.session_state.cart = {}
-if 'orders' not in st.session_state:
-    st.session_state.orders = []
+    st.session_state.cart = Cart()
+if 'customer_id' not in st.session_state:
+    st.session_state.customer_id = uuid.uuid4().hex
 if 'wishlist' not in st.session_state:
-    st.session_state.wishlist = set()
+    st.session_state.wishlist = Wishlist()
 if 'viewed_products' not in st.session_state:
-    st.session_state.viewed_products = []
-
-# Enhanced Product Data with More Items
-PRODUCTS = [
-    {
-        "id": 1,
-        "name": "🌈 Rainbow Sneakers",
-        "price": 89.99,
-        "category": "Footwear",
-        "emoji": "👟",
-        "description": "Vibrant colorful sneakers with rainbow gradient design",
-        "rating": 4.7,
-        "stock": 15,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": True,
-        "original_price": 119.99,
-        "tags": ["Trending", "Limited"]
-    },
-    {
-        "id": 2,
-        "name": "🎧 Neon Wireless Headphones",
-        "price": 149.99,
-        "category": "Electronics",
-        "emoji": "🎧",
-        "description": "RGB LED headphones with neon glow and 40hr battery",
-        "rating": 4.9,
-        "stock": 8,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": False,
-        "tags": ["Bestseller", "New"]
-    },
-    {
-        "id": 3,
-        "name": "👕 Tie-Dye Collection T-Shirt",
-        "price": 29.99,
-        "category": "Clothing",
-        "emoji": "👕",
-        "description": "Organic cotton tie-dye t-shirt in psychedelic colors",
-        "rating": 4.5,
-        "stock": 25,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": True,
-        "original_price": 39.99,
-        "tags": ["Eco-Friendly"]
-    },
-    {
-        "id": 4,
-        "name": "⌚ Gradient Smart Watch",
-        "price": 329.99,
-        "category": "Electronics",
-        "emoji": "⌚",
-        "description": "Color-changing display with animated watch faces",
-        "rating": 4.8,
-        "stock": 5,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": False,
-        "tags": ["Premium", "Smart"]
-    },
-    {
-        "id": 5,
-        "name": "🎒 Multicolor Backpack",
-        "price": 99.99,
-        "category": "Accessories",
-        "emoji": "🎒",
-        "description": "Waterproof backpack with color-changing panels",
-        "rating": 4.6,
-        "stock": 12,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": True,
-        "original_price": 139.99,
-        "tags": ["Waterproof"]
-    },
-    {
-        "id": 6,
-        "name": "🧘 Rainbow Yoga Mat",
-        "price": 49.99,
-        "category": "Fitness",
-        "emoji": "🧘",
-        "description": "Non-slip yoga mat with mandala rainbow pattern",
-        "rating": 4.4,
-        "stock": 20,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": False,
-        "tags": ["Fitness"]
-    },
-    {
-        "id": 7,
-        "name": "☕ Color-Changing Mug",
-        "price": 19.99,
-        "category": "Home",
-        "emoji": "☕",
-        "description": "Mug that reveals colors with hot liquid",
-        "rating": 4.7,
-        "stock": 30,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": True,
-        "original_price": 29.99,
-        "tags": ["Magic", "Fun"]
-    },
-    {
-        "id": 8,
-        "name": "🖱️ RGB Gaming Mouse",
-        "price": 69.99,
-        "category": "Electronics",
-        "emoji": "🖱️",
-        "description": "16.8 million color RGB gaming mouse",
-        "rating": 4.9,
-        "stock": 7,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": False,
-        "tags": ["Gaming", "RGB"]
-    },
-    {
-        "id": 9,
-        "name": "🕶️ Gradient Sunglasses",
-        "price": 45.99,
-        "category": "Accessories",
-        "emoji": "🕶️",
-        "description": "Color gradient lenses with UV protection",
-        "rating": 4.3,
-        "stock": 18,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": True,
-        "original_price": 59.99,
-        "tags": ["Summer", "Style"]
-    },
-    {
-        "id": 10,
-        "name": "📱 Pastel Phone Case",
-        "price": 24.99,
-        "category": "Accessories",
-        "emoji": "📱",
-        "description": "Soft pastel colors with glitter accents",
-        "rating": 4.6,
-        "stock": 22,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": False,
-        "tags": ["Pastel", "Cute"]
-    },
-    {
-        "id": 11,
-        "name": "💄 Neon Lipstick Set",
-        "price": 34.99,
-        "category": "Beauty",
-        "emoji": "💄",
-        "description": "Vibrant neon lip colors for bold looks",
-        "rating": 4.8,
-        "stock": 14,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": True,
-        "original_price": 49.99,
-        "tags": ["Beauty", "Vibrant"]
-    },
-    {
-        "id": 12,
-        "name": "🎨 Artist's Brush Set",
-        "price": 39.99,
-        "category": "Art",
-        "emoji": "🎨",
-        "description": "Colorful brush set with rainbow handles",
-        "rating": 4.9,
-        "stock": 9,
-        "image_color": random.choice(list(COLORS.values())),
-        "on_sale": False,
-        "tags": ["Art", "Creative"]
-    }
-]
+    st.session_state.viewed_products = RecentlyViewed()
+if 'notices' not in st.session_state:
+    st.session_state.notices = {}
+
+@st.cache_resource
+def load_catalog():
+    """Open the catalog database and its connection pool once per server process"""
+    catalog = open_catalog(DEFAULT_DB_PATH)
+    seed(catalog)
+    return catalog
+
+CATALOG = load_catalog()
+
+@st.cache_resource
+def load_inventory():
+    """Stock reservations shared by every session"""
+    return Inventory(CATALOG)
+
+INVENTORY = load_inventory()
+
+@st.cache_resource
+def load_pricing_engine():
+    """Compiled promo rules, shipping and tax"""
+    return PricingEngine()
+
+PRICING = load_pricing_engine()
+
+@st.cache_resource
+def load_card_renderer():
+    """Process-wide memo of product card HTML"""
+    return CardRenderer()
+
+CARD_RENDERER = load_card_renderer()
+
+@st.cache_resource
+def load_image_store():
+    """Product image thumbnails, rendered once to the static cache"""
+    # Streamlit serves the static folder next to the script, whatever the working directory
+    return ImageStore(cache_dir=os.path.join(os.path.dirname(os.path.abspath(__file__)), DEFAULT_THUMB_DIR))
+
+IMAGES = load_image_store()
+
+@st.cache_resource
+def load_order_store():
+    """Durable order log and its group-commit writer, once per server process"""
+    return OrderStore(DEFAULT_ORDERS_DB_PATH)
+
+ORDERS = load_order_store()
+
+@st.cache_resource
+def load_order_ids():
+    """Time-sortable order IDs, unique across sessions and server processes"""
+    return IdGenerator("ORD-")
+
+NEW_ORDER_ID = load_order_ids()
+
+@st.cache_resource
+def load_event_log():
+    """Clickstream sink and its background writer"""
+    return EventLog(DEFAULT_EVENTS_PATH)
+
+EVENTS = load_event_log()
+
+@st.cache_resource
+def load_derived_views():
+    """Derived catalog views shared by every session, rebuilt when the catalog version moves"""
+    return VersionedCache()
+
+DERIVED_VIEWS = load_derived_views()
+
+def catalog_view(name, build, catalog_version=None):
+    """A derived view of the current catalog, built once across all sessions"""
+    if catalog_version is None:
+        catalog_version = CATALOG.version
+    return DERIVED_VIEWS.get(name, catalog_version, build)
+
+def build_catalog_views():
+    """Columnar view plus facet bitsets"""
+    columns = ColumnarCatalog(CATALOG)
+    return columns, FacetIndex(columns)
+
+def load_search_index(catalog_version):
+    """Build the search index once per catalog version"""
+    return catalog_view("search_index", lambda: SearchIndex(CATALOG.all()), catalog_version)
+
+def load_catalog_views(catalog_version):
+    """Build the columnar view and facet bitsets once per catalog version"""
+    return catalog_view("columns_facets", build_catalog_views, catalog_version)
+
+def load_recommender(catalog_version):
+    """Item-to-item neighbours once per catalog version, kept current from the order log"""
+    columns, facets = load_catalog_views(catalog_version)
+    return catalog_view("recommender", lambda: Recommender(columns, facets), catalog_version)
+
+# Product views and grid pagination
+PRODUCT_TABS = ["🌈 All Products", "🔥 On Sale", "💖 Wishlist", "🎯 Recommended", "📦 My Orders"]
+ALL_CATEGORIES = "All Categories"
+MAX_TAG_OPTIONS = 30
+PAGE_SIZE_OPTIONS = [8, 12, 24, 48]
+SEARCH_RESULT_LIMIT = 240
+RECOMMENDATION_LIMIT = 8
+ORDER_PAGE_SIZE = 10
+SORT_KEYS = {
+    "Recommended": "id",
+    "Price: Low to High": "price",
+    "Price: High to Low": "-price",
+    "Rating": "-rating",
+    "Newest": "-id"
+}
+
+# Fragments that show cart or wishlist state and rerun when it changes
+HEADER_FRAGMENT = "header_metrics"
+SIDEBAR_FRAGMENT = "sidebar_cart"
+CART_FRAGMENTS = [HEADER_FRAGMENT, SIDEBAR_FRAGMENT]
 
 # Helper Functions
-def add_to_cart(product_id, quantity=1):
+def add_to_cart(product_id, quantity=1, owner=SIDEBAR_FRAGMENT):
     """Add product to cart with animation"""
-    if product_id in st.session_state.cart:
-        st.session_state.cart[product_id] += quantity
-    else:
-        st.session_state.cart[product_id] = quantity
-    
-    # Add to recently viewed
-    if product_id not in st.session_state.viewed_products:
-        st.session_state.viewed_products.append(product_id)
-        if len(st.session_state.viewed_products) > 5:
-            st.session_state.viewed_products.pop(0)
+    product = get_product_by_id(product_id)
+    if not product:
+        return
+    if st.session_state.cart.quantity(product_id) + quantity > product["stock"]:
+        queue_notice(owner, f"😔 Only {product['stock']} {product['name']} left in stock", kind="warning")
+        return
+    st.session_state.cart.add(product, quantity)
+    st.session_state.viewed_products.touch(product_id)
+    record_event("add_to_cart", product_id=product_id, quantity=quantity)
     
-    st.success(f"🎉 Added to cart! 🛒")
-    st.balloons()
+    queue_notice(owner, "🎉 Added to cart! 🛒", celebrate=True)
 
 def remove_from_cart(product_id):
     """Remove product from cart"""
-    if product_id in st.session_state.cart:
-        del st.session_state.cart[product_id]
-        st.success("🗑️ Item removed from cart")
-        st.rerun()
+    if st.session_state.cart.remove(product_id):
+        queue_notice(SIDEBAR_FRAGMENT, "🗑️ Item removed from cart")
 
 def clear_cart():
     """Clear all items from cart"""
     st.session_state.cart.clear()
-    st.success("✨ Cart cleared!")
+    queue_notice(SIDEBAR_FRAGMENT, "✨ Cart cleared!")
 
-def toggle_wishlist(product_id):
+def toggle_wishlist(product_id, owner=SIDEBAR_FRAGMENT):
     """Add/remove from wishlist"""
     if product_id in st.session_state.wishlist:
         st.session_state.wishlist.remove(product_id)
-        st.success("💔 Removed from wishlist")
+        record_event("wishlist", product_id=product_id, added=False)
+        queue_notice(owner, "💔 Removed from wishlist")
     else:
         st.session_state.wishlist.add(product_id)
-        st.success("💖 Added to wishlist!")
-        st.balloons()
+        record_event("wishlist", product_id=product_id, added=True)
+        queue_notice(owner, "💖 Added to wishlist!", celebrate=True)
 
+@PROFILER.timed()
 def checkout():
     """Process checkout with colorful celebration"""
     if not st.session_state.cart:
-        st.warning("Your cart is empty! Add some colorful items first! 🌈")
+        queue_notice(SIDEBAR_FRAGMENT, "Your cart is empty! Add some colorful items first! 🌈", kind="warning")
         return
     
-    total = calculate_cart_total()
+    quote = get_cart_quote()
     order = {
-        "timestamp": datetime.now(),
-        "items": st.session_state.cart.copy(),
-        "total": total,
-        "order_id": f"ORD-{random.randint(1000, 9999)}-{datetime.now().strftime('%H%M%S')}"
+        "created_at": time.time(),
+        "customer_id": st.session_state.customer_id,
+        "items": st.session_state.cart.to_dict(),
+        "total": quote.total_cents / 100,
+        "order_id": NEW_ORDER_ID()
     }
     
-    st.session_state.orders.append(order)
+    # Take the stock first - all lines or none, so two sessions can't sell the same last unit
+    try:
+        INVENTORY.reserve(order["items"])
+    except OutOfStock as error:
+        names = ", ".join(
+            f"{product['name']} ({error.shortages[product['id']]} left)"
+            for product in CATALOG.get_many(error.shortages)
+        )
+        queue_notice(SIDEBAR_FRAGMENT, f"😔 Not enough stock for: {names}", kind="warning")
+        return
+    
+    # Blocks until the order's group commit is on disk. Any failure - a database
+    # error, a rejected order, or a timeout waiting on the writer - hands the
+    # reserved stock back rather than leaking it
+    try:
+        ORDERS.append(order)
+    except Exception:
+        INVENTORY.release(order["items"])
+        queue_notice(SIDEBAR_FRAGMENT, "We couldn't place your order - please try again 🙏", kind="error")
+        return
+    record_event("checkout", order_id=order["order_id"], total=order["total"], items=sum(order["items"].values()))
     st.session_state.cart.clear()
+    st.session_state.pop("promo_code", None)
+    st.session_state.pop("order_cursors", None)
+    st.session_state.last_order = order
+
+def view_product(product_id):
+    """A shopper looked at a product's details"""
+    st.session_state.viewed_products.touch(product_id)
+    record_event("view", product_id=product_id)
+
+def record_event(event, **fields):
+    """Queue a clickstream event for this session - no I/O on the request path"""
+    EVENTS.record(event, st.session_state.customer_id, **fields)
+
+def display_order_confirmation():
+    """Show the order placed by the last checkout, once"""
+    order = st.session_state.pop("last_order", None)
+    if not order:
+        return
     
     # Celebration effects
     st.balloons()
@@ -594,7 +810,7 @@ def checkout():
             <h1 style='font-size: 2.5rem; margin-bottom: 1rem;'>🎊 Order Successful!</h1>
             <div style='font-size: 1.2rem;'>
                 <p><strong>🎯 Order ID:</strong> {order['order_id']}</p>
-                <p><strong>💰 Total:</strong> ${total:.2f}</p>
+                <p><strong>💰 Total:</strong> ${order['total']:.2f}</p>
                 <p><strong>📦 Items:</strong> {sum(order['items'].values())}</p>
             </div>
             <p style='margin-top: 1.5rem; font-size: 1.1rem;'>
@@ -603,24 +819,86 @@ def checkout():
         </div>
         """, unsafe_allow_html=True)
 
-def calculate_cart_total():
-    """Calculate total cart value"""
-    total = 0
-    for product_id, quantity in st.session_state.cart.items():
-        product = next((p for p in PRODUCTS if p["id"] == product_id), None)
-        if product:
-            total += product["price"] * quantity
-    return total
+@PROFILER.timed()
+def get_cart_quote():
+    """Priced cart - recomputed only when the cart, promo code or catalog changes"""
+    cart = st.session_state.cart
+    promo_code = st.session_state.get("promo_code", "")
+    # The revision, not the version - a bulk import changes prices well before it publishes
+    key = (cart.version, promo_code, CATALOG.revision)
+    cached = st.session_state.get("cart_quote")
+    if cached is None or cached[0] != key:
+        quote = PRICING.quote(cart.to_dict(), CATALOG.get_many(cart), promo_code)
+        cached = st.session_state.cart_quote = (key, quote)
+    return cached[1]
 
 def get_cart_count():
     """Get total number of items in cart"""
-    return sum(st.session_state.cart.values())
+    return st.session_state.cart.count
 
 def get_product_by_id(product_id):
     """Get product by ID"""
-    return next((p for p in PRODUCTS if p["id"] == product_id), None)
+    return CATALOG.get(product_id)
+
+# Fragment notices and reruns
+def queue_notice(owner, message, kind="success", celebrate=False):
+    """Remember an action message for the fragment that shows it"""
+    st.session_state.notices[owner] = (kind, message, celebrate)
+
+def display_notice(owner):
+    """Show the pending message for a fragment, once"""
+    notice = st.session_state.notices.pop(owner, None)
+    if notice:
+        kind, message, celebrate = notice
+        getattr(st, kind)(message)
+        if celebrate:
+            st.balloons()
+
+def rerun_cart_views(*fragment_keys):
+    """Rerun the given fragments plus every fragment that shows the cart"""
+    st.rerun([*fragment_keys, *CART_FRAGMENTS])
+
+def on_add_to_cart(product_id, card_key, quantity_key):
+    """Add to Cart callback - reruns the card and the cart views only"""
+    version = st.session_state.cart.version
+    add_to_cart(product_id, st.session_state[quantity_key], owner=card_key)
+    if st.session_state.cart.version != version:
+        rerun_cart_views(card_key)
+
+def on_toggle_wishlist(product_id, card_key):
+    """Wishlist heart callback"""
+    toggle_wishlist(product_id, owner=card_key)
+    if st.session_state.get("active_tab") == PRODUCT_TABS[2]:
+        # The wishlist grid itself changes shape
+        st.rerun()
+    rerun_cart_views(card_key)
+
+def on_remove_from_cart(product_id):
+    """Sidebar remove callback"""
+    remove_from_cart(product_id)
+    rerun_cart_views()
+
+def on_clear_cart():
+    """Sidebar Clear Cart callback"""
+    clear_cart()
+    rerun_cart_views()
+
+def on_details_toggle(product_id, details_key):
+    """Details expander callback - record opens, the card fragment reruns to fill it"""
+    if st.session_state.get(details_key):
+        view_product(product_id)
+
+def on_promo_code():
+    """Promo code input callback - only the views showing the quote rerun"""
+    rerun_cart_views()
+
+def on_checkout():
+    """Sidebar Checkout callback"""
+    checkout()
+    rerun_cart_views()
 
 # Colorful UI Components
+@PROFILER.timed()
 def display_colorful_header():
     """Display vibrant header"""
     col1, col2, col3 = st.columns([1, 3, 1])
@@ -629,7 +907,12 @@ def display_colorful_header():
         st.markdown('<h1 class="main-header">🌈 VibeCart</h1>', unsafe_allow_html=True)
         st.markdown('<p class="sub-header">Where Every Color Tells a Story 🎨</p>', unsafe_allow_html=True)
     
-    # Metrics bar
+    display_header_metrics()
+
+@st.fragment(key=HEADER_FRAGMENT)
+@PROFILER.timed()
+def display_header_metrics():
+    """Display metrics bar - reruns on its own when the cart or wishlist changes"""
     with st.container():
         col1, col2, col3, col4 = st.columns(4)
         
@@ -637,7 +920,7 @@ def display_colorful_header():
             st.markdown(f"""
             <div class='metric-card'>
                 <div style='font-size: 2rem;'>🛍️</div>
-                <div class='metric-value'>{len(PRODUCTS)}</div>
+                <div class='metric-value'>{catalog_view("product_count", lambda: len(CATALOG))}</div>
                 <div>Products</div>
             </div>
             """, unsafe_allow_html=True)
@@ -646,7 +929,7 @@ def display_colorful_header():
             st.markdown(f"""
             <div class='metric-card'>
                 <div style='font-size: 2rem;'>🏷️</div>
-                <div class='metric-value'>{len([p for p in PRODUCTS if p.get('on_sale')])}</div>
+                <div class='metric-value'>{catalog_view("sale_count", CATALOG.sale_count)}</div>
                 <div>On Sale</div>
             </div>
             """, unsafe_allow_html=True)
@@ -662,7 +945,7 @@ def display_colorful_header():
             """, unsafe_allow_html=True)
         
         with col4:
-            cart_total = calculate_cart_total()
+            cart_total = get_cart_quote().total_cents / 100
             st.markdown(f"""
             <div class='metric-card'>
                 <div style='font-size: 2rem;'>💰</div>
@@ -671,392 +954,560 @@ def display_colorful_header():
             </div>
             """, unsafe_allow_html=True)
 
-def display_colorful_product_card(product):
-    """Display individual product card with vibrant colors"""
+@PROFILER.timed()
+def display_colorful_product_card(product, key_prefix="all"):
+    """Display individual product card as its own fragment"""
+    card_key = f"card_{key_prefix}_{product['id']}"
+    st.fragment(render_product_card, key=card_key)(product, key_prefix, card_key)
+
+@PROFILER.timed()
+def render_product_card(product, key_prefix, card_key):
+    """Render product card - one cached HTML block plus the interactive widgets"""
+    # Checkouts move stock without bumping the catalog version, so it is part of the key;
+    # thumbnail URLs are content-addressed, so a replaced image changes the key too
+    image_url = IMAGES.url(product["id"], "card")
+    if image_url:
+        product = {**product, "image_url": image_url}
+    version = (product["version"], product["stock"], image_url)
     with st.container():
-        st.markdown(f'<div class="product-card">', unsafe_allow_html=True)
-        
-        # Sale badge with animation
-        if product.get("on_sale", False):
-            discount = int(100 * (1 - product["price"] / product["original_price"]))
-            st.markdown(f'<div class="sale-badge">🔥 {discount}% OFF</div>', unsafe_allow_html=True)
-        
-        # Animated emoji
-        st.markdown(f'<div class="product-emoji">{product["emoji"]}</div>', unsafe_allow_html=True)
-        
-        # Product info
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.markdown(f'<div class="product-title">{product["name"]}</div>', unsafe_allow_html=True)
-            
-            # Tags
-            if "tags" in product:
-                tag_cols = st.columns(len(product["tags"]))
-                for idx, tag in enumerate(product["tags"]):
-                    with tag_cols[idx]:
-                        st.markdown(f'<span style="background:{COLORS["info"]}20; color:{COLORS["info"]}; padding:2px 8px; border-radius:10px; font-size:0.7rem;">{tag}</span>', unsafe_allow_html=True)
-            
-            # Rating
-            full_stars = int(product["rating"])
-            half_star = 1 if product["rating"] - full_stars >= 0.5 else 0
-            empty_stars = 5 - full_stars - half_star
-            
-            stars = "★" * full_stars + "⭐" * half_star + "☆" * empty_stars
-            st.markdown(f'<div class="rating">{stars} {product["rating"]}</div>', unsafe_allow_html=True)
-            
-        with col2:
-            # Category badge
-            category_colors = {
-                "Electronics": COLORS["info"],
-                "Clothing": COLORS["warning"],
-                "Footwear": COLORS["primary"],
-                "Accessories": COLORS["purple"],
-                "Fitness": COLORS["success"],
-                "Home": COLORS["accent"],
-                "Beauty": COLORS["orange"],
-                "Art": COLORS["secondary"]
-            }
-            cat_color = category_colors.get(product["category"], COLORS["dark"])
-            st.markdown(f'<div class="product-category" style="background:{cat_color}">{product["category"]}</div>', unsafe_allow_html=True)
-        
-        # Price section
-        col1, col2 = st.columns(2)
-        with col1:
-            if product.get("on_sale", False):
-                st.markdown(f'''
-                <div>
-                    <span class="product-price">${product["price"]:.2f}</span><br>
-                    <span style="text-decoration: line-through; color: #999; font-size: 0.9rem;">
-                        ${product["original_price"]:.2f}
-                    </span>
-                </div>
-                ''', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="product-price">${product["price"]:.2f}</div>', unsafe_allow_html=True)
-        
-        with col2:
-            # Stock indicator with color
-            if product["stock"] > 10:
-                stock_color = COLORS["success"]
-                stock_text = f"✅ {product['stock']} left"
-            elif product["stock"] > 0:
-                stock_color = COLORS["warning"]
-                stock_text = f"⚠️ {product['stock']} left"
-            else:
-                stock_color = COLORS["dark"]
-                stock_text = "❌ Out of stock"
-            
-            st.markdown(f'<div style="color: {stock_color}; font-size: 0.9rem; margin: 5px 0;">{stock_text}</div>', unsafe_allow_html=True)
+        st.markdown(CARD_RENDERER.card(product, version), unsafe_allow_html=True)
         
         # Action buttons
         col1, col2, col3 = st.columns([2, 2, 1])
+        quantity_key = f"{key_prefix}_qty_{product['id']}"
         
         with col1:
-            quantity = st.number_input(
+            st.number_input(
                 "Quantity", 
                 min_value=1, 
-                max_value=min(10, product["stock"]), 
+                max_value=max(1, min(10, product["stock"])), 
                 value=1,
-                key=f"qty_{product['id']}",
+                key=quantity_key,
+                disabled=product["stock"] <= 0,
                 label_visibility="collapsed"
             )
         
         with col2:
             if product["stock"] > 0:
-                if st.button(
+                st.button(
                     "🛒 Add to Cart",
-                    key=f"add_{product['id']}",
+                    key=f"{key_prefix}_add_{product['id']}",
+                    on_click=on_add_to_cart,
+                    args=(product["id"], card_key, quantity_key),
                     use_container_width=True,
                     type="secondary"
-                ):
-                    add_to_cart(product["id"], quantity)
+                )
             else:
                 st.button(
                     "😔 Out of Stock",
+                    key=f"{key_prefix}_oos_{product['id']}",
                     disabled=True,
                     use_container_width=True
                 )
         
         with col3:
             wishlist_icon = "💖" if product["id"] in st.session_state.wishlist else "🤍"
-            if st.button(
+            st.button(
                 wishlist_icon,
-                key=f"wish_{product['id']}",
+                key=f"{key_prefix}_wish_{product['id']}",
+                on_click=on_toggle_wishlist,
+                args=(product["id"], card_key),
                 use_container_width=True
-            ):
-                toggle_wishlist(product["id"])
+            )
         
-        # Product details expander
-        with st.expander("✨ Details & Reviews"):
-            st.write(product["description"])
-            st.progress(product["rating"] / 5, text=f"Rating: {product['rating']}/5")
-            
-            # Simulated reviews
-            reviews = [
-                {"user": "ColorLover", "rating": 5, "comment": "So vibrant! Love it! 🌈"},
-                {"user": "StyleKing", "rating": 4, "comment": "Great quality, perfect colors"},
-                {"user": "RainbowQueen", "rating": 5, "comment": "Exactly what I wanted!"}
-            ]
-            
-            for review in reviews:
-                st.markdown(f"**{review['user']}** ({'⭐' * review['rating']})")
-                st.caption(review["comment"])
-                st.divider()
+        display_notice(card_key)
         
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Product details expander - opening it is a product view, and the
+        # details are only sent while it is open
+        details = st.expander(
+            "✨ Details & Reviews",
+            key=f"{key_prefix}_details_{product['id']}",
+            on_change=on_details_toggle,
+            args=(product["id"], f"{key_prefix}_details_{product['id']}")
+        )
+        if details.open:
+            detail_url = IMAGES.url(product["id"], "detail")
+            if detail_url:
+                product = {**product, "detail_image_url": detail_url}
+            with details:
+                st.markdown(CARD_RENDERER.details(product, version + (detail_url,)), unsafe_allow_html=True)
 
+@PROFILER.timed()
 def display_colorful_sidebar():
     """Display vibrant sidebar"""
     with st.sidebar:
-        # Sidebar header with gradient
+        display_sidebar_cart()
+        
+        # Promo code
+        st.divider()
+        with st.expander("🎁 Promo Codes"):
+            st.markdown(STATIC_ASSETS["promo_codes"].content, unsafe_allow_html=True)
+            st.text_input("Promo code", key="promo_code", placeholder="Enter a code", on_change=on_promo_code)
+
+@st.fragment(key=SIDEBAR_FRAGMENT)
+@PROFILER.timed()
+def display_sidebar_cart():
+    """Display sidebar cart and wishlist - reruns on its own when either changes"""
+    # Sidebar header with gradient
+    st.markdown(f"""
+    <div style='
+        background: linear-gradient(135deg, {COLORS['primary']}, {COLORS['purple']});
+        padding: 1.5rem;
+        border-radius: 15px;
+        color: white;
+        margin-bottom: 1.5rem;
+        text-align: center;
+    '>
+        <h2 style='margin: 0;'>🛒 Your Cart <span class='cart-badge'>{get_cart_count()}</span></h2>
+        <p style='margin: 0.5rem 0 0 0; opacity: 0.9;'>Colorful items waiting for you!</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Free shipping progress
+    quote = get_cart_quote()
+    cart_total = quote.subtotal_cents - quote.discount_cents
+
+    if cart_total > 0:
+        progress = min(cart_total / PRICING.free_shipping_cents, 1)
+        remaining = max(0, PRICING.free_shipping_cents - cart_total) / 100
+    
+        st.progress(progress)
+    
+        if quote.shipping_cents:
+            st.info(f"🎁 Add **${remaining:.2f}** more for **FREE shipping!**")
+        else:
+            st.success("🎉 You've earned **FREE shipping!**")
+
+    st.divider()
+
+    # Cart items
+    if not st.session_state.cart:
+        st.markdown("""
+        <div style='
+            text-align: center;
+            padding: 2rem;
+            background: #ffffff10;
+            border-radius: 10px;
+        '>
+            <div style='font-size: 3rem;'>🛍️</div>
+            <h3>Your cart is empty</h3>
+            <p>Add some colorful items to brighten up your day!</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        for product_id, quantity in st.session_state.cart.items():
+            product = get_product_by_id(product_id)
+            if product:
+                col1, col2, col3 = st.columns([3, 2, 1])
+                with col1:
+                    st.write(f"{product['emoji']} **{product['name']}**")
+                with col2:
+                    st.write(f"${product['price']} × {quantity}")
+                with col3:
+                    st.button("🗑️", key=f"remove_{product_id}", on_click=on_remove_from_cart, args=(product_id,))
+    
+        st.divider()
+    
+        # Cart summary with colors
+        subtotal = quote.subtotal_cents / 100
+        shipping = quote.shipping_cents / 100
+        tax = quote.tax_cents / 100
+        total = quote.total_cents / 100
+        discount_row = f"""
+            <div style='display: flex; justify-content: space-between;'>
+                <span>Promo {quote.promo_code}:</span>
+                <span><strong>-${quote.discount_cents / 100:.2f}</strong></span>
+            </div>""" if quote.discount_cents else ""
+    
         st.markdown(f"""
         <div style='
-            background: linear-gradient(135deg, {COLORS['primary']}, {COLORS['purple']});
+            background: linear-gradient(135deg, {COLORS['success']}20, {COLORS['secondary']}20);
             padding: 1.5rem;
             border-radius: 15px;
-            color: white;
-            margin-bottom: 1.5rem;
-            text-align: center;
+            border: 2px solid {COLORS['success']};
         '>
-            <h2 style='margin: 0;'>🛒 Your Cart <span class='cart-badge'>{get_cart_count()}</span></h2>
-            <p style='margin: 0.5rem 0 0 0; opacity: 0.9;'>Colorful items waiting for you!</p>
+            <h4>💰 Order Summary</h4>
+            <div style='display: flex; justify-content: space-between;'>
+                <span>Subtotal:</span>
+                <span><strong>${subtotal:.2f}</strong></span>
+            </div>{discount_row}
+            <div style='display: flex; justify-content: space-between;'>
+                <span>Shipping:</span>
+                <span><strong>{'FREE' if shipping == 0 else f'${shipping:.2f}'}</strong></span>
+            </div>
+            <div style='display: flex; justify-content: space-between;'>
+                <span>Tax ({PRICING.tax_percent}%):</span>
+                <span><strong>${tax:.2f}</strong></span>
+            </div>
+            <hr>
+            <div style='display: flex; justify-content: space-between; font-size: 1.3rem;'>
+                <span>Total:</span>
+                <span style='color: {COLORS["primary"]}; font-weight: 800;'>${total:.2f}</span>
+            </div>
         </div>
         """, unsafe_allow_html=True)
-        
-        # Free shipping progress
-        cart_total = calculate_cart_total()
-        free_shipping_threshold = 100
-        
-        if cart_total > 0:
-            progress = min(cart_total / free_shipping_threshold, 1)
-            remaining = max(0, free_shipping_threshold - cart_total)
-            
-            st.progress(progress)
-            
-            if cart_total < free_shipping_threshold:
-                st.info(f"🎁 Add **${remaining:.2f}** more for **FREE shipping!**")
-            else:
-                st.success("🎉 You've earned **FREE shipping!**")
-        
+    
+        if quote.promo_error:
+            st.caption(f"🎟️ {quote.promo_error}")
+    
+        # Checkout buttons
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button("🗑️ Clear Cart", on_click=on_clear_cart, use_container_width=True, type="secondary")
+        with col2:
+            st.button("🚀 Checkout Now", on_click=on_checkout, use_container_width=True, type="primary")
+
+    display_notice(SIDEBAR_FRAGMENT)
+    display_order_confirmation()
+
+    # Wishlist section
+    if st.session_state.wishlist:
         st.divider()
-        
-        # Cart items
-        if not st.session_state.cart:
-            st.markdown("""
-            <div style='
-                text-align: center;
-                padding: 2rem;
-                background: #ffffff10;
-                border-radius: 10px;
-            '>
-                <div style='font-size: 3rem;'>🛍️</div>
-                <h3>Your cart is empty</h3>
-                <p>Add some colorful items to brighten up your day!</p>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            for product_id, quantity in st.session_state.cart.items():
+        with st.expander(f"💖 Wishlist ({len(st.session_state.wishlist)})"):
+            for product_id in list(st.session_state.wishlist)[:5]:
                 product = get_product_by_id(product_id)
                 if product:
-                    col1, col2, col3 = st.columns([3, 2, 1])
-                    with col1:
-                        st.write(f"{product['emoji']} **{product['name']}**")
-                    with col2:
-                        st.write(f"${product['price']} × {quantity}")
-                    with col3:
-                        if st.button("🗑️", key=f"remove_{product_id}"):
-                            remove_from_cart(product_id)
-            
-            st.divider()
-            
-            # Cart summary with colors
-            subtotal = calculate_cart_total()
-            shipping = 0 if subtotal >= 100 else 9.99
-            tax = subtotal * 0.08
-            total = subtotal + shipping + tax
-            
-            st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, {COLORS['success']}20, {COLORS['secondary']}20);
-                padding: 1.5rem;
-                border-radius: 15px;
-                border: 2px solid {COLORS['success']};
-            '>
-                <h4>💰 Order Summary</h4>
-                <div style='display: flex; justify-content: space-between;'>
-                    <span>Subtotal:</span>
-                    <span><strong>${subtotal:.2f}</strong></span>
-                </div>
-                <div style='display: flex; justify-content: space-between;'>
-                    <span>Shipping:</span>
-                    <span><strong>{'FREE' if shipping == 0 else f'${shipping:.2f}'}</strong></span>
-                </div>
-                <div style='display: flex; justify-content: space-between;'>
-                    <span>Tax (8%):</span>
-                    <span><strong>${tax:.2f}</strong></span>
-                </div>
-                <hr>
-                <div style='display: flex; justify-content: space-between; font-size: 1.3rem;'>
-                    <span>Total:</span>
-                    <span style='color: {COLORS["primary"]}; font-weight: 800;'>${total:.2f}</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Checkout buttons
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("🗑️ Clear Cart", use_container_width=True, type="secondary"):
-                    clear_cart()
-            with col2:
-                if st.button("🚀 Checkout Now", use_container_width=True, type="primary"):
-                    checkout()
-        
-        # Wishlist section
-        if st.session_state.wishlist:
-            st.divider()
-            with st.expander(f"💖 Wishlist ({len(st.session_state.wishlist)})"):
-                for product_id in list(st.session_state.wishlist)[:5]:
-                    product = get_product_by_id(product_id)
-                    if product:
-                        st.write(f"{product['emoji']} {product['name']} - ${product['price']}")
-        
-        # Promo code
-        st.divider()
-        with st.expander("🎁 Promo Codes"):
-            st.code("VIBECART20 - 20% off all orders")
-            st.code("COLORME50 - $50 off orders over $200")
-            st.code("RAINBOW10 - 10% off colorful items")
+                    st.write(f"{product['emoji']} {product['name']} - ${product['price']}")
 
+@PROFILER.timed()
 def display_products_with_tabs():
-    """Display products with colorful tabs"""
-    tab1, tab2, tab3, tab4 = st.tabs(["🌈 All Products", "🔥 On Sale", "💖 Wishlist", "🎯 Recommended"])
+    """Display products with colorful tabs - only the active tab is built"""
+    active_tab = st.segmented_control(
+        "Browse",
+        PRODUCT_TABS,
+        default=PRODUCT_TABS[0],
+        key="active_tab",
+        label_visibility="collapsed"
+    ) or PRODUCT_TABS[0]
     
-    with tab1:
-        display_product_grid()
+    if active_tab == PRODUCT_TABS[0]:
+        query = st.text_input(
+            "Search",
+            placeholder="🔍 Search products, tags and categories...",
+            key="search_query",
+            label_visibility="collapsed"
+        ).strip()
+        if query:
+            display_search_results(query)
+        else:
+            display_product_grid(key="all")
     
-    with tab2:
-        sale_products = [p for p in PRODUCTS if p.get("on_sale", False)]
-        if sale_products:
-            display_product_grid(sale_products)
+    elif active_tab == PRODUCT_TABS[1]:
+        if catalog_view("sale_count", CATALOG.sale_count):
+            display_product_grid(key="sale", on_sale=True)
         else:
             st.info("No items on sale at the moment")
     
-    with tab3:
-        wishlist_products = [p for p in PRODUCTS if p["id"] in st.session_state.wishlist]
+    elif active_tab == PRODUCT_TABS[2]:
+        wishlist_products = CATALOG.get_many(st.session_state.wishlist)
         if wishlist_products:
-            display_product_grid(wishlist_products)
+            display_product_grid(wishlist_products, key="wish", load_more=True)
         else:
             st.info("Add items to your wishlist by clicking the 💖 button!")
     
-    with tab4:
-        # Recently viewed + recommendations
-        recommended = []
-        if st.session_state.viewed_products:
-            for product_id in st.session_state.viewed_products:
-                product = get_product_by_id(product_id)
-                if product:
-                    # Get products from same category
-                    category_products = [p for p in PRODUCTS if p["category"] == product["category"] and p["id"] != product_id]
-                    recommended.extend(category_products[:2])
+    elif active_tab == PRODUCT_TABS[4]:
+        display_order_history()
+    
+    else:
+        # Neighbours of the recently viewed products, most recent first
+        recommender = load_recommender(CATALOG.version)
+        recommender.refresh(ORDERS)
+        recommended_ids = recommender.recommend(
+            list(reversed(st.session_state.viewed_products)),
+            limit=RECOMMENDATION_LIMIT,
+            exclude=st.session_state.cart.to_dict()
+        )
+        recommended = CATALOG.get_many(recommended_ids)
         
         if not recommended:
-            recommended = [p for p in PRODUCTS if p["rating"] >= 4.7][:4]
+            # Only the ids are shared - stock moves without a catalog version bump,
+            # so the rows themselves are read fresh on every render
+            top_rated = catalog_view("top_rated_ids", lambda: [p["id"] for p in CATALOG.query(min_rating=4.7, limit=4)])
+            recommended = CATALOG.get_many(top_rated)
         
         if recommended:
-            display_product_grid(recommended[:8])
+            display_product_grid(recommended, key="rec")
         else:
             st.info("Browse products to get recommendations!")
 
-def display_product_grid(products_list=None):
-    """Display products in a responsive grid"""
-    products = products_list or PRODUCTS
+@PROFILER.timed()
+def display_order_history():
+    """This session's orders, newest first, read from the order log a page at a time"""
+    # Keyset pagination: a stack of cursors, one per page visited so far
+    cursors = st.session_state.setdefault("order_cursors", [None])
+    orders, next_cursor = ORDERS.history(st.session_state.customer_id, cursors[-1], limit=ORDER_PAGE_SIZE)
+    if not orders:
+        st.info("No orders yet - your colorful hauls will show up here! 📦")
+        return
+    
+    for order in orders:
+        placed = datetime.fromtimestamp(order["created_at"]).strftime("%b %d, %H:%M")
+        st.markdown(
+            f"**{order['order_id']}** · {placed} · {order['item_count']} items · **&#36;{order['total']:.2f}**"
+        )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("◀ Newer", key="orders_newer", disabled=len(cursors) == 1,
+                  on_click=cursors.pop, use_container_width=True)
+    with col2:
+        st.button("Older ▶", key="orders_older", disabled=next_cursor is None,
+                  on_click=cursors.append, args=(next_cursor,), use_container_width=True)
+
+@PROFILER.timed()
+def display_search_results(query):
+    """Display ranked search results in the product grid"""
+    product_ids = load_search_index(CATALOG.version).search(query, limit=SEARCH_RESULT_LIMIT)
+    if product_ids:
+        display_product_grid(CATALOG.get_many(product_ids), key="search")
+    else:
+        st.info(f"No colorful items match “{query}” - try another word! 🎨")
+
+@PROFILER.timed()
+def display_product_grid(products_list=None, key="all", load_more=False, on_sale=None):
+    """Display one page of products in a responsive grid"""
+    columns, facets = load_catalog_views(CATALOG.version)
+    
+    # Current filter values - read before drawing the widgets so each facet can show counts
+    selected_category = st.session_state.get(f"{key}_filter_cat", ALL_CATEGORIES)
+    selected_tags = st.session_state.get(f"{key}_filter_tags", [])
+    min_rating = st.session_state.get(f"{key}_filter_rating")
+    price_range = st.session_state.get(f"{key}_price_range", (0, 500))
+    
+    base_bits = facets.price_range(*price_range)
+    if on_sale:
+        base_bits &= facets.select("on_sale", [True])
+    if products_list is not None:
+        base_bits &= facets.for_ids(p["id"] for p in products_list)
+    category_bits = facets.select("category", [] if selected_category == ALL_CATEGORIES else [selected_category])
+    tag_bits = facets.select("tag", selected_tags)
+    rating_bits = facets.select("rating", [] if min_rating is None else [min_rating])
+    
+    # Each facet counts matches under all the other filters
+    category_counts = facets.counts("category", base_bits & tag_bits & rating_bits)
+    tag_counts = facets.counts("tag", base_bits & category_bits & rating_bits)
+    rating_counts = facets.counts("rating", base_bits & category_bits & tag_bits)
     
     # Filters
-    col1, col2, col3 = st.columns([2, 2, 2])
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
     
     with col1:
-        categories = ["All Categories"] + list(set(p["category"] for p in products))
-        selected_category = st.selectbox("Filter", categories, key="filter_cat")
+        categories = [ALL_CATEGORIES] + [
+            c for c in facets.values("category") if category_counts[c] or c == selected_category
+        ]
+        st.selectbox(
+            "Filter",
+            categories,
+            format_func=lambda c: c if c == ALL_CATEGORIES else f"{c} ({category_counts.get(c, 0)})",
+            key=f"{key}_filter_cat"
+        )
     
     with col2:
-        sort_options = ["Recommended", "Price: Low to High", "Price: High to Low", "Rating", "Newest"]
-        sort_by = st.selectbox("Sort", sort_options, key="sort_by")
+        sort_options = list(SORT_KEYS)
+        sort_by = st.selectbox("Sort", sort_options, key=f"{key}_sort_by")
     
     with col3:
-        price_range = st.slider("Price Range", 0, 500, (0, 500), key="price_range")
+        st.slider("Price Range", 0, 500, (0, 500), key=f"{key}_price_range")
+    
+    with col4:
+        page_size = st.selectbox("Per page", PAGE_SIZE_OPTIONS, index=1, key=f"{key}_page_size")
+    
+    col1, col2 = st.columns([4, 2])
+    
+    with col1:
+        popular_tags = sorted((t for t in tag_counts if tag_counts[t]), key=lambda t: -tag_counts[t])[:MAX_TAG_OPTIONS]
+        st.multiselect(
+            "Tags",
+            list(dict.fromkeys(popular_tags + selected_tags)),
+            format_func=lambda t: f"{t} ({tag_counts.get(t, 0)})",
+            placeholder="Any tag",
+            key=f"{key}_filter_tags"
+        )
     
-    # Filter products
-    filtered_products = products.copy()
+    with col2:
+        st.selectbox(
+            "Rating",
+            [None] + facets.values("rating"),
+            format_func=lambda r: "Any rating" if r is None else f"{r}★ & up ({rating_counts[r]})",
+            key=f"{key}_filter_rating"
+        )
     
-    if selected_category != "All Categories":
-        filtered_products = [p for p in filtered_products if p["category"] == selected_category]
+    # Filter products with bit operations
+    matching_bits = base_bits & category_bits & tag_bits & rating_bits
+    total = facets.count(matching_bits)
+    sort_key = SORT_KEYS[sort_by]
     
-    filtered_products = [p for p in filtered_products if price_range[0] <= p["price"] <= price_range[1]]
+    if products_list is not None and sort_key == "id":
+        # Keep the list's own order (relevance, recency)
+        keep = facets.contains(matching_bits, np.maximum(columns.rows_of(p["id"] for p in products_list), 0))
+        filtered_products = [p for p, kept in zip(products_list, keep) if kept]
+    else:
+        # Mask plus gather over a precomputed order - yields row numbers, not dicts
+        matching_rows = columns.sorted_rows(facets.mask(matching_bits), sort_key)
     
-    # Sort products
-    if sort_by == "Price: Low to High":
-        filtered_products.sort(key=lambda x: x["price"])
-    elif sort_by == "Price: High to Low":
-        filtered_products.sort(key=lambda x: x["price"], reverse=True)
-    elif sort_by == "Rating":
-        filtered_products.sort(key=lambda x: x["rating"], reverse=True)
-    elif sort_by == "Newest":
-        filtered_products.sort(key=lambda x: x["id"], reverse=True)
+    # Only the visible slice gets built into cards
+    page_key = f"{key}_page"
+    filter_state = (selected_category, tuple(selected_tags), min_rating, sort_by, price_range, page_size, total)
+    if st.session_state.get(f"{key}_filter_state") != filter_state:
+        st.session_state[f"{key}_filter_state"] = filter_state
+        st.session_state[page_key] = 0
+    
+    page_count = max(1, -(-total // page_size))
+    page = min(st.session_state[page_key], page_count - 1)
+    start = 0 if load_more else page * page_size
+    end = (page + 1) * page_size
+    if products_list is not None and sort_key == "id":
+        visible_products = filtered_products[start:end]
+    elif products_list is not None:
+        by_id = {p["id"]: p for p in products_list}
+        visible_products = [by_id[pid] for pid in columns.ids_of(matching_rows[start:end])]
+    else:
+        # Only this page is loaded from the database
+        visible_products = CATALOG.get_many(columns.ids_of(matching_rows[start:end]))
     
     # Display count
-    st.markdown(f"### 🎨 Found **{len(filtered_products)}** colorful items")
+    st.markdown(f"### 🎨 Found **{total}** colorful items")
     
     # Responsive grid
     cols = st.columns(4)
     
-    for idx, product in enumerate(filtered_products):
+    for idx, product in enumerate(visible_products):
         with cols[idx % 4]:
-            display_colorful_product_card(product)
+            display_colorful_product_card(product, key_prefix=key)
+    
+    display_page_controls(page_key, page, page_count, load_more)
+
+def set_page(page_key, page):
+    """Button callback - move a grid to another page"""
+    st.session_state[page_key] = page
+
+def display_page_controls(page_key, page, page_count, load_more=False):
+    """Display previous/next or load-more controls under a grid"""
+    if page_count <= 1:
+        return
+    
+    if load_more:
+        if page + 1 < page_count:
+            st.button(
+                "✨ Load more",
+                key=f"{page_key}_more",
+                on_click=set_page,
+                args=(page_key, page + 1),
+                use_container_width=True
+            )
+        return
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button(
+            "◀ Prev",
+            key=f"{page_key}_prev",
+            disabled=page == 0,
+            on_click=set_page,
+            args=(page_key, page - 1),
+            use_container_width=True
+        )
+    with col2:
+        st.markdown(f"<div style='text-align: center;'>Page <strong>{page + 1}</strong> of {page_count}</div>", unsafe_allow_html=True)
+    with col3:
+        st.button(
+            "Next ▶",
+            key=f"{page_key}_next",
+            disabled=page + 1 >= page_count,
+            on_click=set_page,
+            args=(page_key, page + 1),
+            use_container_width=True
+        )
 
 def display_colorful_footer():
     """Display vibrant footer"""
-    st.markdown("""
-    <div class='footer'>
-        <div style='display: grid; grid-template-columns: repeat(4, 1fr); gap: 2rem;'>
-            <div>
-                <h3 style='color: white;'>🌈 VibeCart</h3>
-                <p>Your colorful shopping destination</p>
-                <p>Making shopping vibrant since 2024</p>
-            </div>
-            <div>
-                <h4 style='color: white;'>Quick Links</h4>
-                <p>🎯 New Arrivals</p>
-                <p>🔥 Best Sellers</p>
-                <p>💖 Wishlist</p>
-                <p>🛍️ Collections</p>
-            </div>
-            <div>
-                <h4 style='color: white;'>Support</h4>
-                <p>📞 1-800-COLORFUL</p>
-                <p>✉️ help@vibecart.com</p>
-                <p>📍 Color Street 123</p>
-                <p>🕒 24/7 Support</p>
-            </div>
-            <div>
-                <h4 style='color: white;'>Stay Colorful</h4>
-                <p>📱 Follow us on Instagram</p>
-                <p>🐦 Tweet with #VibeCart</p>
-                <p>📧 Subscribe for colorful deals</p>
-                <p>⭐ Rate us 5 stars</p>
-            </div>
-        </div>
-        <hr style='border-color: rgba(255,255,255,0.2); margin: 2rem 0;'>
-        <div style='text-align: center; color: rgba(255,255,255,0.8);'>
-            <p>© 2024 VibeCart. All rights reserved. | Made with ❤️ and 🌈 | This is a demo e-commerce application.</p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(STATIC_ASSETS["footer"].content, unsafe_allow_html=True)
+
+def live_session_states():
+    """Session state of every connected session - just this one outside a running server"""
+    # Streamlit has no public session listing, so this reads the runtime's session manager
+    session_mgr = getattr(Runtime.instance(), "_session_mgr", None) if Runtime.exists() else None
+    if session_mgr is None:
+        return [st.session_state.to_dict()]
+    return [info.session.session_state.filtered_state for info in session_mgr.list_active_sessions()]
+
+def is_admin():
+    """Whether this session may see the admin panel"""
+    if os.environ.get("VIBECART_ADMIN") == "1":
+        return True
+    return ADMIN_TOKEN is not None and st.query_params.get("admin") == ADMIN_TOKEN
+
+def on_profiling_toggle():
+    """Admin switch - turns timing on or off for the whole process"""
+    PROFILER.enabled = st.session_state.admin_profiling
+
+def display_admin_panel():
+    """Hidden admin page - hot-path timings and process-wide cache and memory stats"""
+    st.markdown("---")
+    st.markdown("## 🛠️ Admin")
+    
+    st.toggle("Record timings", value=PROFILER.enabled, key="admin_profiling", on_change=on_profiling_toggle)
+    stats = PROFILER.stats()
+    if stats:
+        st.caption(f"{PROFILER.script_runs} full-script runs timed (fragment reruns not counted) - "
+                   "slowest total first; percentiles are histogram bucket bounds")
+        st.dataframe(stats, hide_index=True)
+        st.button("Reset timings", key="admin_reset_timings", on_click=PROFILER.reset)
+    elif PROFILER.enabled:
+        st.caption("No timings yet - interact with the store and rerun")
+    
+    with st.expander("📦 Shared caches"):
+        st.json({
+            "derived_views": {name: {"hits": hits, "misses": misses} for name, (hits, misses) in DERIVED_VIEWS.stats().items()},
+            "card_renderer": {"hits": CARD_RENDERER.hits, "misses": CARD_RENDERER.misses},
+            "images": {"rendered": IMAGES.rendered, "format": IMAGES.image_format},
+            "events": {"recorded": EVENTS.recorded, "written": EVENTS.written, "dropped": EVENTS.dropped},
+        })
+    
+    display_exports()
+    display_session_memory()
+
+def export_file(export, source, fmt, compress):
+    """Deferred download data - streamed into a temp file only when the button is clicked"""
+    def build():
+        # Unbuffered, so it is a raw file download_button accepts
+        spool = tempfile.TemporaryFile(buffering=0)
+        for data in export(source, fmt, compress):
+            spool.write(data)
+        spool.seek(0)
+        return spool
+    return build
+
+def display_exports():
+    """Catalog feed and order history downloads"""
+    with st.expander("📤 Exports"):
+        col1, col2 = st.columns(2)
+        with col1:
+            fmt = st.selectbox("Format", FORMATS, key="admin_export_format")
+        with col2:
+            compress = st.toggle("gzip", value=True, key="admin_export_gzip")
+        for kind, export, source in (("catalog", export_catalog, CATALOG), ("orders", export_orders, ORDERS)):
+            st.download_button(
+                f"⬇️ {kind.title()} ({fmt}{', gzip' if compress else ''})",
+                data=export_file(export, source, fmt, compress),
+                file_name=file_name(kind, fmt, compress),
+                mime=mime_type(fmt, compress),
+                key=f"admin_export_{kind}",
+                on_click="ignore"
+            )
+        st.caption("For full-size exports use `python -m vibecart.exports`, which writes in constant memory")
+
+def display_session_memory():
+    """Bytes per session and across live sessions"""
+    with st.expander("🧠 Session memory"):
+        this_session = deep_sizeof(st.session_state.to_dict())
+        st.write(f"This session: {this_session:,} bytes (budget {SESSION_BYTES_BUDGET:,})")
+        st.json(session_footprint(live_session_states()))
 
 # Main App
 def main():
     """Main app function"""
+    PROFILER.script_run()
     display_colorful_header()
     display_colorful_sidebar()
     display_products_with_tabs()
@@ -1065,37 +1516,12 @@ def main():
     st.markdown("---")
     st.markdown("## 🎨 Colorful Collections")
     
-    collections = [
-        {"name": "Rainbow Collection", "emoji": "🌈", "color": COLORS["primary"]},
-        {"name": "Pastel Dreams", "emoji": "🌸", "color": COLORS["purple"]},
-        {"name": "Neon Nights", "emoji": "🌃", "color": COLORS["warning"]},
-        {"name": "Gradient Glow", "emoji": "🎆", "color": COLORS["secondary"]}
-    ]
-    
-    cols = st.columns(4)
-    for idx, collection in enumerate(collections):
-        with cols[idx]:
-            st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, {collection['color']}, {collection['color']}80);
-                padding: 2rem;
-                border-radius: 15px;
-                color: white;
-                text-align: center;
-                height: 150px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-                cursor: pointer;
-                transition: transform 0.3s;
-            ' onmouseover="this.style.transform='scale(1.05)'" onmouseout="this.style.transform='scale(1)'">
-                <div style='font-size: 2.5rem; margin-bottom: 0.5rem;'>{collection['emoji']}</div>
-                <h3 style='margin: 0;'>{collection['name']}</h3>
-                <p style='margin: 0; opacity: 0.9;'>Explore →</p>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(STATIC_ASSETS["collections"].content, unsafe_allow_html=True)
     
     display_colorful_footer()
+    
+    if is_admin():
+        display_admin_panel()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,47 @@
+"""
+Lookup and cart-total cost: linear PRODUCTS scan vs ProductCatalog index.
+
+    python -m benchmarks.bench_catalog
+"""
+
+import random
+import timeit
+
+from benchmarks.synthetic import make_products
+from vibecart.catalog import ProductCatalog
+
+SIZES = [1_000, 10_000, 50_000, 100_000]
+CART_LINES = 20
+
+
+def linear_get(products, product_id):
+    return next((p for p in products if p["id"] == product_id), None)
+
+
+def linear_total(products, cart):
+    return sum(linear_get(products, pid)["price"] * qty for pid, qty in cart.items())
+
+
+def indexed_total(catalog, cart):
+    return sum(catalog.get(pid)["price"] * qty for pid, qty in cart.items())
+
+
+def main():
+    print(f"{'size':>8} {'scan get µs':>12} {'index get µs':>13} {'scan total µs':>14} {'index total µs':>15}")
+    for size in SIZES:
+        products = make_products(size)
+        catalog = ProductCatalog(products)
+        rng = random.Random(size)
+        ids = [rng.randint(1, size) for _ in range(200)]
+        cart = {pid: rng.randint(1, 3) for pid in rng.sample(range(1, size + 1), CART_LINES)}
+
+        scan_get = min(timeit.repeat(lambda: [linear_get(products, i) for i in ids], number=1, repeat=3)) / len(ids)
+        index_get = min(timeit.repeat(lambda: [catalog.get(i) for i in ids], number=100, repeat=3)) / (100 * len(ids))
+        scan_total = min(timeit.repeat(lambda: linear_total(products, cart), number=1, repeat=3))
+        index_total = min(timeit.repeat(lambda: indexed_total(catalog, cart), number=1000, repeat=3)) / 1000
+        print(f"{size:>8} {scan_get * 1e6:>12.2f} {index_get * 1e6:>13.3f} "
+              f"{scan_total * 1e6:>14.1f} {index_total * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Query latency of the SQLite catalog repository at 100k+ products.
+
+    python -m benchmarks.bench_catalog_db [--size 100000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.synthetic import CATEGORIES, make_products
+from vibecart.catalog_db import CatalogRepository
+
+
+def timed(label, fn, repeat=50):
+    """Print median latency of fn in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    print(f"{label:<44} {samples[len(samples) // 2] * 1e3:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = CatalogRepository(os.path.join(tmp, "bench.db"))
+        products = make_products(args.size)
+        start = time.perf_counter()
+        for offset in range(0, len(products), 10_000):
+            repo.upsert_many(products[offset:offset + 10_000])
+        print(f"loaded {args.size} products in {time.perf_counter() - start:.2f} s")
+
+        rng = random.Random(1)
+        timed("get by id", lambda: repo.get(rng.randint(1, args.size)))
+        timed("get_many (20 ids)", lambda: repo.get_many(rng.sample(range(1, args.size), 20)))
+        timed("count on_sale", lambda: repo.count(on_sale=True))
+        timed("count category + price range", lambda: repo.count(category=rng.choice(CATEGORIES), price_min=50, price_max=150))
+        timed("page 1, category, price asc", lambda: repo.query(category=rng.choice(CATEGORIES), sort="price", limit=12))
+        timed("page 1, price range, price desc", lambda: repo.query(price_min=20, price_max=200, sort="-price", limit=12))
+        timed("page 50, all, id", lambda: repo.query(limit=12, offset=600))
+        timed("page 1, on_sale, rating desc", lambda: repo.query(on_sale=True, sort="-rating", limit=12))
+        timed("categories", repo.categories)
+        repo.pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Filter-then-sort-then-page: the old dict-list path vs the columnar view.
+
+    python -m benchmarks.bench_columns [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import time
+
+from benchmarks.synthetic import make_products
+from vibecart.columns import ColumnarCatalog
+
+PAGE_SIZE = 12
+CASES = [
+    ("Electronics, price asc", "Electronics", "price"),
+    ("all, price desc", None, "-price"),
+    ("all, rating desc", None, "-rating"),
+    ("Home, newest", "Home", "-id"),
+]
+
+
+def best_of(fn, repeat=5):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return min(samples) * 1e3
+
+
+def dict_page(products, category, sort_key):
+    """What display_product_grid used to do: copy, filter, list.sort, slice"""
+    filtered = products.copy()
+    if category:
+        filtered = [p for p in filtered if p["category"] == category]
+    filtered = [p for p in filtered if 0 <= p["price"] <= 500]
+    field = sort_key.lstrip("-")
+    if sort_key != "id":
+        filtered.sort(key=lambda x: x[field], reverse=sort_key.startswith("-"))
+    return filtered[:PAGE_SIZE]
+
+
+def columnar_page(columns, by_id, category, sort_key):
+    """Mask, gather over the precomputed order, turn only the page into dicts"""
+    mask = columns.price_mask(0, 500)
+    if category:
+        mask &= columns.category_codes == columns.categories.index(category)
+    rows = columns.sorted_rows(mask, sort_key)[:PAGE_SIZE]
+    return [by_id[pid] for pid in columns.ids_of(rows)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        products = make_products(size)
+        by_id = {p["id"]: p for p in products}
+        start = time.perf_counter()
+        columns = ColumnarCatalog(products)
+        print(f"\n{size} products - columnar view built in {time.perf_counter() - start:.2f} s")
+        print(f"  {'case':<26} {'dicts ms':>10} {'columnar ms':>12} {'speedup':>8}")
+        for label, category, sort_key in CASES:
+            expected = [p["id"] for p in dict_page(products, category, sort_key)]
+            assert expected == [p["id"] for p in columnar_page(columns, by_id, category, sort_key)], label
+            old = best_of(lambda: dict_page(products, category, sort_key))
+            new = best_of(lambda: columnar_page(columns, by_id, category, sort_key))
+            print(f"  {label:<26} {old:>10.2f} {new:>12.3f} {old / new:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Clickstream recording cost on the request path - buffered EventLog vs a
+synchronous JSONL write per event.
+
+    python -m benchmarks.bench_events [--events 200000]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from vibecart.events import EventLog
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sync.jsonl")
+        with open(path, "a", encoding="utf-8") as sink:
+            start = time.perf_counter()
+            for n in range(args.events):
+                sink.write(json.dumps({"ts": time.time(), "event": "view", "session": "s", "product_id": n}) + "\n")
+                sink.flush()
+            elapsed = time.perf_counter() - start
+        print(f"write + flush per event   {elapsed / args.events * 1e6:7.2f} us/event on the request path")
+
+        log = EventLog(os.path.join(tmp, "buffered.jsonl"), max_buffer=args.events + 1)
+        start = time.perf_counter()
+        for n in range(args.events):
+            log.record("view", "s", product_id=n)
+        recorded = time.perf_counter() - start
+        log.close()
+        drained = time.perf_counter() - start
+        print(f"EventLog.record           {recorded / args.events * 1e6:7.2f} us/event on the request path")
+        print(f"writer                    {log.written} events in {log.batches} batches, "
+              f"all on disk after {drained:.2f} s, {log.dropped} dropped")
+
+
+if __name__ == "__main__":
+    main()
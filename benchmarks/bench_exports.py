@@ -0,0 +1,91 @@
+"""
+Catalog and order exports - throughput and memory for each format.
+
+Fills a temporary catalog and order log (in batches, never holding them
+whole), then exports both in every format, plain and gzipped, to /dev/null.
+Peak RSS should not grow with --products since exports hold one batch.
+
+    python -m benchmarks.bench_exports [--products 1000000] [--orders 100000]
+"""
+
+import argparse
+import os
+import random
+import resource
+import tempfile
+import time
+
+from benchmarks.synthetic import iter_products
+from vibecart.exports import FORMATS, ExportStats, export_catalog, export_orders
+from vibecart.orders import OrderStore
+from vibecart.seed import open_catalog
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def fill_catalog(repository, count, batch_size=10_000):
+    batch = []
+    for product in iter_products(count):
+        batch.append(product)
+        if len(batch) == batch_size:
+            repository.upsert_many(batch)
+            batch.clear()
+    if batch:
+        repository.upsert_many(batch)
+
+
+def fill_orders(store, count, products):
+    rng = random.Random(0)
+    futures = []
+    for index in range(count):
+        items = {rng.randint(1, products): rng.randint(1, 3) for _ in range(rng.randint(1, 4))}
+        futures.append(store.submit({
+            "order_id": f"ORD-{index:012d}",
+            "customer_id": f"customer-{rng.randrange(count // 10 + 1)}",
+            "created_at": 1_700_000_000 + index,
+            "total": round(rng.uniform(10, 900), 2),
+            "items": items,
+        }))
+        if len(futures) == 5000:
+            for future in futures:
+                future.result()
+            futures.clear()
+    for future in futures:
+        future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--orders", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = open_catalog(os.path.join(tmp, "catalog.db"))
+        orders = OrderStore(os.path.join(tmp, "orders.db"))
+        start = time.perf_counter()
+        fill_catalog(catalog, args.products)
+        fill_orders(orders, args.orders, args.products)
+        print(f"filled {args.products:,} products and {args.orders:,} orders "
+              f"in {time.perf_counter() - start:.1f} s, peak RSS {peak_rss_mb():.0f} MB")
+
+        print(f"{'export':<22} {'rows':>10} {'MB':>8} {'s':>7} {'rows/s':>10} {'peak RSS MB':>12}")
+        with open(os.devnull, "wb") as sink:
+            for kind, export, source in (("catalog", export_catalog, catalog), ("orders", export_orders, orders)):
+                for fmt in FORMATS:
+                    for compress in (False, True):
+                        stats = ExportStats()
+                        for data in export(source, fmt, compress, stats):
+                            sink.write(data)
+                        label = f"{kind} {fmt}{' gzip' if compress else ''}"
+                        print(f"{label:<22} {stats.rows:>10,} {stats.bytes / 2**20:>8.1f} {stats.seconds:>7.2f} "
+                              f"{stats.rows_per_second:>10,.0f} {peak_rss_mb():>12.0f}")
+
+        orders.close()
+        catalog.pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Filtering and facet counting: list comprehensions over dicts vs FacetIndex bitsets.
+
+    python -m benchmarks.bench_facets
+"""
+
+import time
+
+from benchmarks.synthetic import make_products
+from vibecart.columns import ColumnarCatalog
+from vibecart.facets import FacetIndex
+
+SIZES = [10_000, 100_000]
+
+
+def best_of(fn, repeat=10):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return min(samples) * 1e3
+
+
+def dict_filter(products):
+    """The old grid path: category, price range and tag via list comprehensions"""
+    filtered = [p for p in products if p["category"] == "Electronics"]
+    filtered = [p for p in filtered if 20 <= p["price"] <= 300]
+    filtered = [p for p in filtered if "Trending" in p["tags"] or "New" in p["tags"]]
+    counts = {}
+    for p in products:
+        counts[p["category"]] = counts.get(p["category"], 0) + 1
+    return len(filtered), counts
+
+
+def facet_filter(facets):
+    base = facets.price_range(20, 300) & facets.select("tag", ["Trending", "New"])
+    bits = base & facets.select("category", ["Electronics"])
+    return facets.count(bits), facets.counts("category", base)
+
+
+def main():
+    print(f"{'size':>8} {'dicts ms':>10} {'bitsets ms':>11} {'build s':>8}")
+    for size in SIZES:
+        products = make_products(size)
+        start = time.perf_counter()
+        facets = FacetIndex(ColumnarCatalog(products))
+        build = time.perf_counter() - start
+        assert dict_filter(products)[0] == facet_filter(facets)[0]
+        print(f"{size:>8} {best_of(lambda: dict_filter(products)):>10.2f} "
+              f"{best_of(lambda: facet_filter(facets)):>11.3f} {build:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Order ID generator - throughput, plus a uniqueness and ordering check across
+threads and processes. Exits non-zero on any duplicate.
+
+    python -m benchmarks.bench_ids [--threads 8] [--processes 4] [--per-worker 250000]
+"""
+
+import argparse
+import multiprocessing
+import threading
+import time
+
+from vibecart.ids import IdGenerator
+
+
+def generate(count):
+    """IDs from a fresh generator, as one server process would make them"""
+    new_id = IdGenerator("ORD-")
+    return [new_id() for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--per-worker", type=int, default=250_000)
+    args = parser.parse_args()
+
+    new_id = IdGenerator("ORD-")
+    start = time.perf_counter()
+    for _ in range(args.per_worker):
+        new_id()
+    elapsed = time.perf_counter() - start
+    print(f"single thread      {args.per_worker / elapsed / 1e6:6.2f} M ids/s")
+
+    # One generator shared by every thread, as the app's sessions share it
+    batches = [None] * args.threads
+
+    def worker(index):
+        batches[index] = [new_id() for _ in range(args.per_worker)]
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    thread_ids = [generated for batch in batches for generated in batch]
+    print(f"{args.threads} threads          {len(thread_ids) / elapsed / 1e6:6.2f} M ids/s")
+    in_order = all(batch == sorted(batch) for batch in batches)
+
+    with multiprocessing.Pool(args.processes) as pool:
+        process_ids = [generated for batch in pool.map(generate, [args.per_worker] * args.processes)
+                       for generated in batch]
+
+    all_ids = thread_ids + process_ids
+    duplicates = len(all_ids) - len(set(all_ids))
+    print(f"ids checked        {len(all_ids):>10}")
+    print(f"duplicates         {duplicates:>10}")
+    print(f"per-thread sorted  {in_order!s:>10}")
+    if duplicates or not in_order:
+        raise SystemExit("order IDs are not unique and time-ordered")
+
+
+if __name__ == "__main__":
+    main()
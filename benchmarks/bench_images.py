@@ -0,0 +1,95 @@
+"""
+Product image thumbnails - cold render vs repeat lookups, and output size.
+
+Writes synthetic source photos to a temporary directory, then asks for every
+card and detail thumbnail twice: once cold (decode, resize, encode) and once
+more as a card re-render would. Exits non-zero if the second pass rendered
+anything, i.e. if re-rendering a card ever re-decodes an image.
+
+    python -m benchmarks.bench_images [--images 50] [--source-size 2000] [--lookups 100000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from vibecart.images import SIZES, ImageStore
+
+
+def write_sources(directory, count, side):
+    rng = np.random.default_rng(0)
+    total = 0
+    for product_id in range(1, count + 1):
+        # Smooth gradients plus noise - compresses like a photo, not like flat colour
+        y, x = np.mgrid[0:side, 0:side]
+        base = rng.integers(0, 255, 3)
+        pixels = np.stack([(x * (c + 1) // 8 + y // 4 + base[c]) % 256 for c in range(3)], axis=-1)
+        pixels = (pixels + rng.integers(0, 24, pixels.shape)).clip(0, 255).astype(np.uint8)
+        path = os.path.join(directory, f"{product_id}.jpg")
+        Image.fromarray(pixels).save(path, quality=90)
+        total += os.path.getsize(path)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=50)
+    parser.add_argument("--source-size", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = os.path.join(tmp, "images")
+        cache_dir = os.path.join(tmp, "thumbs")
+        os.makedirs(source_dir)
+        source_bytes = write_sources(source_dir, args.images, args.source_size)
+        store = ImageStore(source_dir, cache_dir)
+        product_ids = list(range(1, args.images + 1))
+
+        start = time.perf_counter()
+        for product_id in product_ids:
+            for size in SIZES:
+                store.url(product_id, size)
+        cold = time.perf_counter() - start
+        rendered_cold = store.rendered
+
+        start = time.perf_counter()
+        for lookup in range(args.lookups):
+            store.url(product_ids[lookup % len(product_ids)], "card")
+        warm = time.perf_counter() - start
+
+        # A fresh process finds the thumbnails on disk and only hashes the sources
+        restarted = ImageStore(source_dir, cache_dir)
+        start = time.perf_counter()
+        for product_id in product_ids:
+            restarted.url(product_id, "card")
+        restart = time.perf_counter() - start
+
+        thumb_bytes = {size: 0 for size in SIZES}
+        for root, _, files in os.walk(cache_dir):
+            for name in files:
+                size = name.rsplit("-", 1)[1].split(".")[0]
+                thumb_bytes[size] += os.path.getsize(os.path.join(root, name))
+
+    print(f"{args.images} sources of {args.source_size}x{args.source_size} px, "
+          f"{source_bytes / args.images / 1024:.0f} KB each, output {store.image_format}")
+    print(f"cold render: {rendered_cold} thumbnails in {cold:.2f} s ({cold / rendered_cold * 1e3:.1f} ms each)")
+    print(f"repeat lookup: {warm / args.lookups * 1e6:.2f} us per card "
+          f"({store.rendered - rendered_cold} re-rendered)")
+    print(f"new process, cache on disk: {restart / args.images * 1e3:.2f} ms per card "
+          f"({restarted.rendered} re-rendered)")
+    for size, total in thumb_bytes.items():
+        print(f"{size:>6} thumbnail: {total / args.images / 1024:.1f} KB each")
+
+    if store.rendered != rendered_cold or restarted.rendered:
+        print("thumbnails were rendered more than once")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Bulk import - stream a large CSV or JSONL feed into a fresh catalog.
+
+Writes a synthetic feed (one row in every reject_every is broken on purpose),
+imports it with vibecart.importer and reports rows per second, rejects by
+reason and peak memory. Peak RSS should stay flat as --rows grows, since only
+one batch is held at a time.
+
+    python -m benchmarks.bench_import [--rows 1000000] [--format csv|jsonl] [--batch-size 5000]
+"""
+
+import argparse
+import csv
+import json
+import os
+import resource
+import tempfile
+import time
+
+from benchmarks.synthetic import iter_products
+from vibecart.importer import import_products, read_feed
+from vibecart.seed import open_catalog
+
+FIELDS = ["id", "name", "price", "category", "emoji", "description", "rating", "stock",
+          "image_color", "on_sale", "original_price", "tags"]
+
+# Each broken row has one of these applied, in turn
+BREAKAGES = [
+    ("price", "n/a"),
+    ("stock", "-3"),
+    ("category", ""),
+    ("original_price", None),
+]
+
+
+def feed_rows(count, reject_every):
+    for index, product in enumerate(iter_products(count)):
+        row = dict(product, tags="|".join(product["tags"]))
+        if reject_every and index % reject_every == reject_every - 1:
+            field, value = BREAKAGES[(index // reject_every) % len(BREAKAGES)]
+            if field == "original_price":
+                row["on_sale"] = True
+            row[field] = value
+        yield row
+
+
+def write_feed(path, feed_format, count, reject_every):
+    with open(path, "w", encoding="utf-8", newline="") as out:
+        if feed_format == "csv":
+            writer = csv.DictWriter(out, FIELDS)
+            writer.writeheader()
+            writer.writerows(feed_rows(count, reject_every))
+        else:
+            for row in feed_rows(count, reject_every):
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--reject-every", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feed_path = os.path.join(tmp, f"feed.{args.format}")
+        start = time.perf_counter()
+        write_feed(feed_path, args.format, args.rows, args.reject_every)
+        print(f"wrote {args.rows:,} rows ({os.path.getsize(feed_path) / 2**20:.0f} MB) "
+              f"in {time.perf_counter() - start:.1f} s")
+
+        repository = open_catalog(os.path.join(tmp, "catalog.db"))
+        rss_before = peak_rss_mb()
+        report = import_products(repository, read_feed(feed_path), args.batch_size)
+        rss_after = peak_rss_mb()
+        stored = len(repository)
+        repository.pool.close()
+
+    print(report.summary().split("\n  line ")[0])
+    print(f"catalog rows: {stored:,}")
+    print(f"peak RSS: {rss_before:.0f} MB before import, {rss_after:.0f} MB after")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Checkout contention on one hot SKU - throughput and oversell (must be zero).
+
+    python -m benchmarks.bench_inventory [--threads 32] [--stock 2000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from benchmarks.synthetic import make_products
+from vibecart.catalog_db import CatalogRepository
+from vibecart.inventory import Inventory, OutOfStock
+
+HOT_ID = 1
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--stock", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = CatalogRepository(os.path.join(tmp, "bench.db"), pool_size=8)
+        products = make_products(1000)
+        for product in products:
+            product["stock"] = 10 ** 6
+        products[0]["stock"] = args.stock
+        repo.upsert_many(products)
+        inventory = Inventory(repo)
+
+        sold = [0] * args.threads
+        carts = [0] * args.threads
+        rejected = [0] * args.threads
+
+        def session(index):
+            rng = random.Random(index)
+            while True:
+                # The hot SKU plus up to two other lines, like a real cart
+                lines = {HOT_ID: rng.randint(1, 3)}
+                for _ in range(rng.randint(0, 2)):
+                    lines[rng.randint(2, 1000)] = 1
+                try:
+                    inventory.reserve(lines)
+                except OutOfStock as error:
+                    rejected[index] += 1
+                    if error.shortages.get(HOT_ID) == 0:
+                        return
+                    continue
+                sold[index] += lines[HOT_ID]
+                carts[index] += 1
+
+        workers = [threading.Thread(target=session, args=(index,)) for index in range(args.threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        attempts = sum(carts) + sum(rejected)
+        remaining = inventory.available(HOT_ID)
+        oversell = sum(sold) - args.stock
+        print(f"{args.threads} threads, {args.stock} units of the hot SKU")
+        print(f"units sold       {sum(sold):>10}")
+        print(f"units remaining  {remaining:>10}")
+        print(f"rejected carts   {sum(rejected):>10}")
+        print(f"oversell         {oversell:>10}")
+        print(f"checkouts        {sum(carts):>10}")
+        print(f"attempts/s       {attempts / elapsed:>10.0f}")
+        repo.pool.close()
+        if oversell > 0 or remaining < 0:
+            raise SystemExit("oversold!")
+
+
+if __name__ == "__main__":
+    main()
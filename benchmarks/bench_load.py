@@ -0,0 +1,173 @@
+"""
+Multi-session load test - scripted shopper journeys through app.py, headless.
+
+Each simulated session is a streamlit AppTest: it loads the page, switches
+tabs, searches, filters and sorts, adds to cart, toggles the wishlist and
+checks out. Every rerun an interaction triggers is timed. Workers are separate
+processes sharing one temporary catalog, order log and event log, so they
+contend the way concurrent sessions on one server would. Results are JSON
+so runs can be diffed between commits.
+
+    python -m benchmarks.bench_load [--sessions 20] [--workers 4] [--products 1000] [--out load.json]
+
+AppTest times include its own element-tree bookkeeping, so compare runs of
+this script with each other rather than with browser timings.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+
+import numpy as np
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def journey(session_index, timings):
+    """One shopper's scripted visit, appending (interaction, seconds) per rerun"""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(session_index)
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+
+    def rerun(interaction):
+        start = time.perf_counter()
+        at.run()
+        timings.append((interaction, time.perf_counter() - start))
+        if at.exception:
+            raise RuntimeError(f"{interaction}: {at.exception[0].message}")
+
+    def refresh():
+        # A fragment rerun leaves only the fragment in the tree; a full rerun
+        # brings back the rest of the page, as the browser would show it
+        rerun("full_rerun")
+
+    def buttons(prefix):
+        return [button for button in at.button if button.key and button.key.startswith(prefix)]
+
+    rerun("load")
+
+    for tab in ("🔥 On Sale", "🎯 Recommended", "🌈 All Products"):
+        at.session_state["active_tab"] = tab
+        rerun("tab")
+
+    at.text_input(key="search_query").input(rng.choice(["rain", "neon", "glow mug", "watch"]))
+    rerun("search")
+    at.text_input(key="search_query").input("")
+    rerun("search")
+
+    category = at.selectbox(key="all_filter_cat")
+    # Options are shown as "Name (count)"; select() wants the raw value
+    category.select(rng.choice(category.options[1:]).rsplit(" (", 1)[0])
+    rerun("filter")
+    sort = at.selectbox(key="all_sort_by")
+    sort.select(rng.choice(sort.options))
+    rerun("filter")
+
+    for _ in range(2):
+        add_buttons = buttons("all_add_")
+        if add_buttons:
+            rng.choice(add_buttons).click()
+            rerun("add_to_cart")
+            refresh()
+
+    wish_buttons = buttons("all_wish_")
+    if wish_buttons:
+        rng.choice(wish_buttons).click()
+        rerun("wishlist")
+        refresh()
+
+    checkout = [button for button in at.sidebar.button if "Checkout" in button.label]
+    if checkout:
+        checkout[0].click()
+        rerun("checkout")
+        refresh()
+
+
+def run_sessions(session_indexes):
+    """Worker process: run journeys one after another, return their timings"""
+    timings = []
+    for session_index in session_indexes:
+        journey(session_index, timings)
+    return timings
+
+
+def summarize(samples):
+    samples = np.array(samples) * 1e3
+    return {
+        "count": len(samples),
+        "mean_ms": round(float(samples.mean()), 2),
+        "p50_ms": round(float(np.percentile(samples, 50)), 2),
+        "p95_ms": round(float(np.percentile(samples, 95)), 2),
+        "p99_ms": round(float(np.percentile(samples, 99)), 2),
+    }
+
+
+def current_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(APP_PATH)).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--out", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Workers inherit these, so every session shares one throwaway data set
+        os.environ["VIBECART_DB"] = os.path.join(tmp, "catalog.db")
+        os.environ["VIBECART_ORDERS_DB"] = os.path.join(tmp, "orders.db")
+        os.environ["VIBECART_EVENTS"] = os.path.join(tmp, "events.jsonl")
+
+        from benchmarks.synthetic import make_products
+        from vibecart.seed import open_catalog
+
+        catalog = open_catalog(os.environ["VIBECART_DB"])
+        catalog.upsert_many(make_products(args.products))
+        catalog.pool.close()
+
+        shares = [list(range(worker, args.sessions, args.workers)) for worker in range(args.workers)]
+        start = time.perf_counter()
+        with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+            results = pool.map(run_sessions, shares)
+        wall = time.perf_counter() - start
+
+    by_interaction = defaultdict(list)
+    for timings in results:
+        for interaction, seconds in timings:
+            by_interaction[interaction].append(seconds)
+    reruns = sum(len(samples) for samples in by_interaction.values())
+
+    report = {
+        "commit": current_commit(),
+        "sessions": args.sessions,
+        "workers": args.workers,
+        "products": args.products,
+        "wall_s": round(wall, 2),
+        "reruns": reruns,
+        "reruns_per_s": round(reruns / wall, 2),
+        "sessions_per_s": round(args.sessions / wall, 3),
+        "interactions": {name: summarize(samples) for name, samples in sorted(by_interaction.items())},
+        "all": summarize([seconds for samples in by_interaction.values() for seconds in samples]),
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as out:
+            out.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Checkout throughput of the durable order log, group commit vs one commit per order.
+
+    python -m benchmarks.bench_orders [--threads 32] [--orders 4000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from vibecart.orders import OrderStore
+
+
+def make_order(n, customer_id):
+    rng = random.Random(n)
+    items = {rng.randint(1, 1000): rng.randint(1, 3) for _ in range(rng.randint(1, 5))}
+    return {
+        "order_id": f"ORD-{n:08d}",
+        "customer_id": customer_id,
+        "created_at": time.time(),
+        "total": round(rng.uniform(5, 500), 2),
+        "items": items,
+    }
+
+
+def run(store, threads, orders):
+    """Checkouts per second with `threads` sessions appending concurrently"""
+    per_thread = orders // threads
+
+    def session(index):
+        for n in range(per_thread):
+            store.append(make_order(index * per_thread + n, f"customer-{index}"))
+
+    workers = [threading.Thread(target=session, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return per_thread * threads / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--orders", type=int, default=4000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, max_batch in [("one commit per order", 1), ("group commit", 512)]:
+            store = OrderStore(os.path.join(tmp, f"orders-{max_batch}.db"), max_batch=max_batch)
+            rate = run(store, args.threads, args.orders)
+            print(f"{label:<24} {rate:10.0f} orders/s  "
+                  f"{store.orders_written / store.commits:6.1f} orders/commit")
+
+            start = time.perf_counter()
+            pages, cursor = 0, None
+            while True:
+                page, cursor = store.history("customer-0", cursor, limit=10)
+                pages += 1
+                if cursor is None:
+                    break
+            print(f"{'':<24} paged customer-0 history: {pages} pages in "
+                  f"{(time.perf_counter() - start) * 1e3:.2f} ms")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Cost of the profiling wrapper per call - switched off, switched on, and no wrapper.
+
+    python -m benchmarks.bench_profiling [--calls 1000000]
+"""
+
+import argparse
+import time
+
+from vibecart.profiling import Profiler
+
+
+def work():
+    return None
+
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    profiler = Profiler(enabled=False)
+    wrapped = profiler.timed()(work)
+    bare = per_call(work, args.calls)
+    off = per_call(wrapped, args.calls)
+    profiler.enabled = True
+    on = per_call(wrapped, args.calls)
+    print(f"no wrapper        {bare:7.0f} ns/call")
+    print(f"profiling off     {off:7.0f} ns/call  (+{off - bare:.0f} ns)")
+    print(f"profiling on      {on:7.0f} ns/call  (+{on - bare:.0f} ns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Recommendation latency at 100k+ products - cold neighbour build vs memoised lookup.
+
+    python -m benchmarks.bench_recommend [--size 100000]
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.synthetic import make_products
+from vibecart.columns import ColumnarCatalog
+from vibecart.facets import FacetIndex
+from vibecart.recommend import Recommender
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    columns = ColumnarCatalog(make_products(args.size))
+    facets = FacetIndex(columns)
+    start = time.perf_counter()
+    recommender = Recommender(columns, facets)
+    print(f"build for {args.size} products      {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+    rng = random.Random(1)
+    viewed = [rng.randint(1, args.size) for _ in range(5)]
+
+    start = time.perf_counter()
+    recommender.recommend(viewed)
+    print(f"recommend, 5 viewed, cold       {(time.perf_counter() - start) * 1e3:8.3f} ms")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        recommender.recommend(viewed)
+    print(f"recommend, 5 viewed, memoised   {(time.perf_counter() - start) / 1000 * 1e3:8.3f} ms")
+
+    orders = [{rng.randint(1, args.size): 1 for _ in range(rng.randint(1, 5))} for _ in range(10_000)]
+    start = time.perf_counter()
+    for items in orders:
+        recommender.record_order(items)
+    print(f"record 10k orders               {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Search index build time and query latency.
+
+    python -m benchmarks.bench_search
+"""
+
+import time
+
+from benchmarks.synthetic import make_products
+from vibecart.search import SearchIndex
+
+SIZES = [10_000, 100_000]
+QUERIES = ["neon", "neo", "rainbow sneakers", "gradient glow ca", "electronics trending", "zzz"]
+
+
+def main():
+    for size in SIZES:
+        products = make_products(size)
+        start = time.perf_counter()
+        index = SearchIndex(products)
+        print(f"\n{size} products - index built in {time.perf_counter() - start:.2f} s")
+        for query in QUERIES:
+            samples = []
+            for _ in range(30):
+                start = time.perf_counter()
+                results = index.search(query, limit=240)
+                samples.append(time.perf_counter() - start)
+            samples.sort()
+            print(f"  {query!r:<26} {len(results):>4} hits  p50 {samples[15] * 1e3:6.2f} ms  p95 {samples[28] * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Bytes per session - the old dict/set/list session model vs the compact one.
+
+    python -m benchmarks.bench_session_memory [--sessions 1000]
+"""
+
+import argparse
+import random
+import uuid
+from datetime import datetime
+
+from vibecart.cart import Cart
+from vibecart.session import Wishlist, session_footprint
+
+
+def old_session(rng):
+    """Session state as the app kept it before - dict cart, set wishlist, every order in memory"""
+    cart = {rng.randint(1, 100_000): rng.randint(1, 3) for _ in range(8)}
+    return {
+        "cart": cart,
+        "wishlist": {rng.randint(1, 100_000) for _ in range(20)},
+        "viewed_products": [rng.randint(1, 100_000) for _ in range(5)],
+        "orders": [
+            {
+                "timestamp": datetime.now(),
+                "items": dict(cart),
+                "total": round(rng.uniform(5, 500), 2),
+                "order_id": f"ORD-{rng.randint(1000, 9999)}-{datetime.now().strftime('%H%M%S')}",
+            }
+            for _ in range(10)
+        ],
+    }
+
+
+def new_session(rng):
+    """Session state now - array cart, array wishlist, orders on disk"""
+    cart = Cart()
+    for _ in range(8):
+        cart.add({"id": rng.randint(1, 100_000), "price": round(rng.uniform(5, 200), 2)}, rng.randint(1, 3))
+    return {
+        "cart": cart,
+        "wishlist": Wishlist(rng.randint(1, 100_000) for _ in range(20)),
+        "viewed_products": [rng.randint(1, 100_000) for _ in range(5)],
+        "customer_id": uuid.uuid4().hex,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    for label, make in [("dicts, sets, orders in session", old_session), ("compact", new_session)]:
+        report = session_footprint([make(rng) for _ in range(args.sessions)])
+        print(f"{label:<32} {report['mean_bytes']:>7,} B/session  "
+              f"{report['total_bytes'] / 2 ** 20:7.2f} MiB for {report['sessions']} sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Derived-view sharing - 1,000 concurrent sessions asking for the same views.
+
+Each view should show one miss per catalog version and a hit for every other
+session. Exits non-zero if any view was built more than once per version.
+
+    python -m benchmarks.bench_views_cache [--sessions 1000] [--size 100000]
+"""
+
+import argparse
+import threading
+import time
+
+from benchmarks.synthetic import make_products
+from vibecart.cache import VersionedCache
+from vibecart.columns import ColumnarCatalog
+from vibecart.facets import FacetIndex
+from vibecart.search import SearchIndex
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    products = make_products(args.size)
+    views = {
+        "columns_facets": lambda: FacetIndex(ColumnarCatalog(products)),
+        "search_index": lambda: SearchIndex(products),
+        "sale_count": lambda: sum(p.get("on_sale", False) for p in products),
+        "top_rated": lambda: sorted(products, key=lambda p: -p["rating"])[:4],
+    }
+    cache = VersionedCache()
+    start_line = threading.Barrier(args.sessions)
+
+    def session(version):
+        start_line.wait()
+        for name, build in views.items():
+            cache.get(name, version, build)
+
+    for version in (1, 2):
+        sessions = [threading.Thread(target=session, args=(version,)) for _ in range(args.sessions)]
+        start = time.perf_counter()
+        for thread in sessions:
+            thread.start()
+        for thread in sessions:
+            thread.join()
+        print(f"catalog version {version}: {args.sessions} sessions served in "
+              f"{time.perf_counter() - start:.2f} s")
+
+    rebuilt = False
+    for name, (hits, misses) in cache.stats().items():
+        print(f"{name:<16} hits {hits:>6}  misses {misses:>3}")
+        rebuilt |= misses != 2
+    if rebuilt:
+        raise SystemExit("a view was built more than once per catalog version")
+
+
+if __name__ == "__main__":
+    main()
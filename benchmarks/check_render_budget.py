@@ -0,0 +1,141 @@
+"""
+Render budget - elements and serialized bytes per page and per product card.
+
+Runs app.py headlessly with AppTest against a fresh demo catalog, measures
+each page view and one product card, and compares them with the checked-in
+render_budget.json. Exits non-zero if anything is over budget, so UI changes
+that quietly add elements or payload are caught before deployment.
+
+    python -m benchmarks.check_render_budget            # check
+    python -m benchmarks.check_render_budget --update   # re-baseline (measured + headroom)
+
+Bytes are the protobuf sizes of the elements and blocks in the rendered tree,
+which is what the deltas sent to the browser carry.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "render_budget.json")
+
+# Room left above the measured numbers when re-baselining
+HEADROOM = 0.10
+
+
+def tree_cost(node):
+    """(elements, bytes) of a rendered AppTest tree"""
+    elements, size = 0, 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        elements += 1
+        size += proto.ByteSize()
+    for child in getattr(node, "children", {}).values():
+        child_elements, child_size = tree_cost(child)
+        elements += child_elements
+        size += child_size
+    return elements, size
+
+
+def measure():
+    """{view name: {"elements": n, "bytes": n}} for each page view and one card"""
+    from streamlit.testing.v1 import AppTest
+
+    def fresh():
+        at = AppTest.from_file(APP_PATH, default_timeout=120)
+        at.run()
+        check(at)
+        return at
+
+    def check(at):
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+
+    def cost(at):
+        elements, size = tree_cost(at._tree)
+        return {"elements": elements, "bytes": size}
+
+    views = {}
+    at = fresh()
+    views["all_products"] = cost(at)
+    for name, tab in [("on_sale", "🔥 On Sale"), ("wishlist", "💖 Wishlist"),
+                      ("recommended", "🎯 Recommended"), ("my_orders", "📦 My Orders")]:
+        at.session_state["active_tab"] = tab
+        at.run()
+        check(at)
+        views[name] = cost(at)
+
+    at = fresh()
+    at.text_input(key="search_query").input("rain").run()
+    check(at)
+    views["search"] = cost(at)
+
+    at = fresh()
+    for product_id in (1, 2, 3):
+        at.button(key=f"all_add_{product_id}").click().run()
+        at.run()
+    check(at)
+    views["all_products_with_cart"] = cost(at)
+
+    # One card: the difference between a page of 12 and a page of 8, over 4
+    at = fresh()
+    at.selectbox(key="all_page_size").select(8).run()
+    small = tree_cost(at._tree)
+    at.selectbox(key="all_page_size").select(12).run()
+    large = tree_cost(at._tree)
+    check(at)
+    views["product_card"] = {"elements": (large[0] - small[0]) / 4, "bytes": (large[1] - small[1]) / 4}
+    return views
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--update", action="store_true", help="write measured numbers plus headroom as the budget")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["VIBECART_DB"] = os.path.join(tmp, "catalog.db")
+        os.environ["VIBECART_ORDERS_DB"] = os.path.join(tmp, "orders.db")
+        os.environ["VIBECART_EVENTS"] = os.path.join(tmp, "events.jsonl")
+        views = measure()
+
+    if args.update:
+        budget = {
+            name: {metric: int(value * (1 + HEADROOM)) + 1 for metric, value in cost.items()}
+            for name, cost in views.items()
+        }
+        with open(BUDGET_PATH, "w", encoding="utf-8") as out:
+            json.dump(budget, out, indent=2)
+            out.write("\n")
+        print(f"wrote {BUDGET_PATH}")
+        return
+
+    with open(BUDGET_PATH, encoding="utf-8") as budget_file:
+        budget = json.load(budget_file)
+
+    over = []
+    print(f"{'view':<24} {'elements':>16} {'bytes':>20}")
+    for name, cost in views.items():
+        limits = budget.get(name)
+        if limits is None:
+            print(f"{name:<24} {cost['elements']:>7.0f} (no budget) {cost['bytes']:>9.0f} (no budget)")
+            continue
+        cells = []
+        for metric in ("elements", "bytes"):
+            flag = " !" if cost[metric] > limits[metric] else "  "
+            if flag.strip():
+                over.append(f"{name} {metric}: {cost[metric]:.0f} > {limits[metric]}")
+            cells.append(f"{cost[metric]:>7.0f} / {limits[metric]:<7}{flag}")
+        print(f"{name:<24} {cells[0]:>16} {cells[1]:>20}")
+
+    if over:
+        print("\nover budget:\n  " + "\n  ".join(over))
+        sys.exit(1)
+    print("\nwithin budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Synthetic catalog generator shared by the benchmarks.
+"""
+
+import random
+
+CATEGORIES = ["Footwear", "Electronics", "Clothing", "Accessories", "Fitness", "Home", "Beauty", "Art"]
+TAGS = ["Trending", "Limited", "Bestseller", "New", "Eco-Friendly", "Premium", "Smart",
+        "Waterproof", "Fitness", "Magic", "Fun", "Gaming", "RGB", "Summer", "Style"]
+WORDS = ["rainbow", "neon", "pastel", "gradient", "glow", "vibrant", "color", "sneakers",
+         "headphones", "shirt", "watch", "backpack", "mat", "mug", "mouse", "sunglasses",
+         "case", "lipstick", "brush", "lamp", "bottle", "hoodie", "speaker", "candle"]
+
+
+def make_products(count, seed=0):
+    """Build `count` product dicts shaped like the demo catalog"""
+    return list(iter_products(count, seed))
+
+
+def iter_products(count, seed=0):
+    """Yield `count` product dicts one at a time, for feeds too big to hold"""
+    rng = random.Random(seed)
+    for product_id in range(1, count + 1):
+        price = round(rng.uniform(5, 500), 2)
+        on_sale = rng.random() < 0.4
+        product = {
+            "id": product_id,
+            "name": " ".join(rng.sample(WORDS, 3)).title(),
+            "price": price,
+            "category": rng.choice(CATEGORIES),
+            "emoji": "🛍️",
+            "description": " ".join(rng.choices(WORDS, k=8)),
+            "rating": round(rng.uniform(3.0, 5.0), 1),
+            "stock": rng.randint(0, 40),
+            "image_color": "#FF6B6B",
+            "on_sale": on_sale,
+            "tags": rng.sample(TAGS, rng.randint(1, 3)),
+        }
+        if on_sale:
+            product["original_price"] = round(price * rng.uniform(1.1, 1.6), 2)
+        yield product
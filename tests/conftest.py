@@ -0,0 +1,39 @@
+import sqlite3
+
+import pytest
+
+from vibecart.catalog_db import CatalogRepository
+
+
+class FailingCommit:
+    """Pooled connection stand-in that can fail its next COMMIT, as under lock contention"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.fail_next_commit = False
+
+    def execute(self, sql, *args):
+        if sql == "COMMIT" and self.fail_next_commit:
+            self.fail_next_commit = False
+            raise sqlite3.OperationalError("database is locked")
+        return self._conn.execute(sql, *args)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """A one-connection catalog, so the next borrower gets the same connection back"""
+    repository = CatalogRepository(str(tmp_path / "catalog.db"), pool_size=1)
+    yield repository
+    repository.pool.close()
+
+
+@pytest.fixture
+def failing_commit(repository):
+    """Wrap the repository's only pooled connection; set fail_next_commit to arm it"""
+    conn = repository.pool._idle.get()
+    wrapper = FailingCommit(conn)
+    repository.pool._idle.put(wrapper)
+    return wrapper
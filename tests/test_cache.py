@@ -0,0 +1,13 @@
+from vibecart.cache import VersionedCache
+
+
+def test_keeps_the_newest_versions_whatever_order_they_are_built_in():
+    cache = VersionedCache(versions_kept=2)
+    cache.get("view", 3, lambda: "v3")
+    cache.get("view", 2, lambda: "v2")
+    # The late build of an older version is returned to its caller but not kept
+    assert cache.get("view", 1, lambda: "v1") == "v1"
+
+    assert cache.get("view", 3, lambda: "rebuilt") == "v3"
+    assert cache.get("view", 2, lambda: "rebuilt") == "v2"
+    assert cache.stats() == {"view": (2, 3)}
@@ -0,0 +1,31 @@
+import sqlite3
+
+import pytest
+
+
+def product(product_id, price=10.0, stock=5):
+    return {"id": product_id, "name": f"Product {product_id}", "price": price, "category": "Art", "stock": stock}
+
+
+def test_failed_commit_rolls_back_and_frees_the_connection(repository, failing_commit):
+    failing_commit.fail_next_commit = True
+    with pytest.raises(sqlite3.OperationalError):
+        repository.upsert_many([product(1)])
+
+    assert not failing_commit.in_transaction
+    assert 1 not in repository
+    # The next borrower can start its own transaction on the same connection
+    repository.upsert_many([product(2)])
+    assert 2 in repository
+
+
+def test_unpublished_writes_move_the_revision_but_not_the_version(repository):
+    repository.upsert_many([product(1)])
+    version = repository.version
+
+    first = repository.upsert_many([product(1, price=12.0)], publish=False)
+    second = repository.upsert_many([product(1, price=14.0)], publish=False)
+
+    assert first < second == repository.revision == repository.version_of(1)
+    assert repository.version == version
+    assert repository.publish() == second == repository.version
@@ -0,0 +1,81 @@
+import gzip
+
+import pytest
+
+from vibecart.importer import RowError, import_products, read_feed, validate_product
+
+
+def feed_row(**fields):
+    row = {"id": "1", "name": "Lamp", "price": "19.99", "category": "Home", "stock": "4"}
+    row.update(fields)
+    return row
+
+
+@pytest.mark.parametrize("raw", ["9007199254740993", 9007199254740993])
+def test_ids_above_2_53_are_exact(raw):
+    assert validate_product(feed_row(id=raw))["id"] == 2 ** 53 + 1
+
+
+@pytest.mark.parametrize("raw", [str(2 ** 63 - 1), 2 ** 63 - 1])
+def test_largest_sqlite_integer_is_accepted(raw):
+    assert validate_product(feed_row(stock=raw))["stock"] == 2 ** 63 - 1
+
+
+@pytest.mark.parametrize("raw, error", [
+    (str(2 ** 63), "stock out of range"),
+    ("2.5", "stock must be a whole number"),
+    ("4.0", "stock must be a whole number"),
+    (2.5, "stock must be a whole number"),
+    (True, "stock must be a whole number"),
+])
+def test_bad_integers_are_rejected(raw, error):
+    with pytest.raises(RowError, match=error):
+        validate_product(feed_row(stock=raw))
+
+
+def test_integral_json_floats_are_accepted():
+    assert validate_product(feed_row(stock=4.0))["stock"] == 4
+
+
+def test_large_ids_round_trip_through_the_catalog(repository):
+    rows = [(2, feed_row(id=str(2 ** 53 + 1))), (3, feed_row(id=str(2 ** 63 - 1), stock=str(2 ** 63 - 1)))]
+    report = import_products(repository, rows)
+
+    assert report.imported == 2
+    assert repository.get(2 ** 53 + 1)["id"] == 2 ** 53 + 1
+    assert repository.get(2 ** 63 - 1)["stock"] == 2 ** 63 - 1
+
+
+@pytest.mark.parametrize("name, open_feed", [("feed.csv", open), ("feed.csv.gz", gzip.open)])
+def test_csv_with_byte_order_mark(tmp_path, name, open_feed):
+    path = str(tmp_path / name)
+    with open_feed(path, "wb") as feed:
+        feed.write("id,name,price,category,stock\r\n7,Lamp,19.99,Home,4\r\n".encode("utf-8-sig"))
+
+    assert list(read_feed(path)) == [(2, {"id": "7", "name": "Lamp", "price": "19.99", "category": "Home", "stock": "4"})]
+
+
+def test_jsonl_with_byte_order_mark(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_bytes('{"id": 7, "name": "Lamp"}\n'.encode("utf-8-sig"))
+
+    assert list(read_feed(str(path))) == [(1, {"id": 7, "name": "Lamp"})]
+
+
+def test_each_batch_gets_a_revision_and_the_version_is_published_once(repository):
+    repository.upsert_many([validate_product(feed_row())])
+    version = repository.version
+    revisions = []
+
+    def progress(report):
+        assert repository.version == version
+        revisions.append((repository.revision, repository.version_of(1), repository.get(1)["price"]))
+
+    rows = [(2, feed_row(price="21.00")), (3, feed_row(id="2")), (4, feed_row(price="23.00"))]
+    import_products(repository, rows, batch_size=2, progress=progress)
+
+    # The price change in the second batch moves the row's revision, while the version waits
+    assert revisions[0][1:] == (revisions[0][0], 21.0)
+    assert revisions[1][1:] == (revisions[1][0], 23.0)
+    assert revisions[0][0] < revisions[1][0]
+    assert repository.version == revisions[1][0] > version
@@ -0,0 +1,36 @@
+import sqlite3
+
+import pytest
+
+from vibecart.inventory import Inventory, OutOfStock
+
+
+def stock_product(product_id, stock):
+    return {"id": product_id, "name": f"Product {product_id}", "price": 10.0, "category": "Art", "stock": stock}
+
+
+def test_reserve_takes_all_lines_or_none(repository):
+    repository.upsert_many([stock_product(1, 3), stock_product(2, 1)])
+    inventory = Inventory(repository)
+
+    with pytest.raises(OutOfStock) as raised:
+        inventory.reserve({1: 2, 2: 2})
+    assert raised.value.shortages == {2: 1}
+    assert inventory.available_many([1, 2]) == {1: 3, 2: 1}
+
+    inventory.reserve({1: 2, 2: 1})
+    assert inventory.available_many([1, 2]) == {1: 1, 2: 0}
+
+
+def test_failed_commit_keeps_the_stock(repository, failing_commit):
+    repository.upsert_many([stock_product(1, 3)])
+    inventory = Inventory(repository)
+    failing_commit.fail_next_commit = True
+
+    with pytest.raises(sqlite3.OperationalError):
+        inventory.reserve({1: 2})
+
+    assert not failing_commit.in_transaction
+    assert inventory.available(1) == 3
+    inventory.reserve({1: 2})
+    assert inventory.available(1) == 1
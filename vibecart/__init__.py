@@ -0,0 +1,4 @@
+"""
+VibeCart core - storefront logic shared by the Streamlit app.
+Nothing in this package imports streamlit, so it can be used from scripts too.
+"""
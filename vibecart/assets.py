@@ -0,0 +1,37 @@
+"""
+Static page assets - minified and content-hashed once, then reused verbatim.
+"""
+
+import hashlib
+import re
+from collections import namedtuple
+
+StaticAsset = namedtuple("StaticAsset", ["name", "content", "digest", "raw_size"])
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,])\s*")
+_CSS_COLON = re.compile(r":\s+")
+_WHITESPACE = re.compile(r"\s+")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+
+
+def minify_css(css):
+    """Strip comments and whitespace that the browser does not need"""
+    css = _CSS_COMMENT.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION.sub(r"\1", css)
+    css = _CSS_COLON.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_html(html):
+    """Collapse indentation and whitespace between tags"""
+    html = _BETWEEN_TAGS.sub("><", html)
+    return _WHITESPACE.sub(" ", html).strip()
+
+
+def build_asset(name, content, minifier=minify_html):
+    """Minify content and tag it with a short content hash"""
+    minified = minifier(content)
+    digest = hashlib.sha256(minified.encode("utf-8")).hexdigest()[:12]
+    return StaticAsset(name, minified, digest, len(content.encode("utf-8")))
@@ -0,0 +1,62 @@
+"""
+Versioned cache - derived catalog views shared by every session in the process.
+
+Each view is built at most once per catalog version: the first session to
+ask builds it while any others asking for the same view wait, and later
+sessions get the same object. Hit and miss counts per view show whether that
+sharing is actually happening.
+"""
+
+import threading
+from collections import Counter
+
+
+class VersionedCache:
+    """Values keyed by (view name, catalog version), keeping the newest few versions"""
+
+    def __init__(self, versions_kept=2):
+        self.versions_kept = versions_kept
+        self._entries = {}
+        self._build_locks = {}
+        self._lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def get(self, name, version, build):
+        """Cached value of a view at a catalog version, calling build() on a miss"""
+        with self._lock:
+            entries = self._entries.get(name)
+            if entries is not None and version in entries:
+                self.hits[name] += 1
+                return entries[version]
+            build_lock = self._build_locks.setdefault(name, threading.Lock())
+
+        with build_lock:
+            # Another session may have built it while we waited
+            with self._lock:
+                entries = self._entries.setdefault(name, {})
+                if version in entries:
+                    self.hits[name] += 1
+                    return entries[version]
+            value = build()
+            with self._lock:
+                self.misses[name] += 1
+                entries[version] = value
+                # A slow build of an old version can finish after a newer one -
+                # evict by version, not by insertion order
+                while len(entries) > self.versions_kept:
+                    del entries[min(entries)]
+            return value
+
+    def invalidate(self, name=None):
+        """Drop one view, or every view"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self):
+        """{view name: (hits, misses)}"""
+        with self._lock:
+            return {name: (self.hits[name], self.misses[name]) for name in sorted(self.hits | self.misses)}
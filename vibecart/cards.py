@@ -0,0 +1,133 @@
+"""
+Product card renderer - the static part of a card as one cached HTML block.
+"""
+
+import html
+import re
+import threading
+from collections import OrderedDict
+
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+REVIEWS = [
+    {"user": "ColorLover", "rating": 5, "comment": "So vibrant! Love it! 🌈"},
+    {"user": "StyleKing", "rating": 4, "comment": "Great quality, perfect colors"},
+    {"user": "RainbowQueen", "rating": 5, "comment": "Exactly what I wanted!"}
+]
+
+
+def category_class(category):
+    """CSS class for a category badge"""
+    return "category-" + _NON_SLUG.sub("-", category.lower()).strip("-")
+
+
+def category_css(category_colors):
+    """One badge rule per known category"""
+    return "".join(f".product-category.{category_class(name)} {{ background: {color}; }}\n"
+                   for name, color in category_colors.items())
+
+
+def star_string(rating):
+    """Five-character star bar for a rating"""
+    full_stars = int(rating)
+    half_star = 1 if rating - full_stars >= 0.5 else 0
+    empty_stars = 5 - full_stars - half_star
+    return "★" * full_stars + "⭐" * half_star + "☆" * empty_stars
+
+
+def render_card_html(product):
+    """Badge, image (or emoji), title, tags, rating, category, price and stock as one block"""
+    esc = html.escape
+    parts = ['<div class="product-card">']
+    if product.get("on_sale", False) and product.get("original_price"):
+        discount = int(100 * (1 - product["price"] / product["original_price"]))
+        parts.append(f'<div class="sale-badge">🔥 {discount}% OFF</div>')
+    if product.get("image_url"):
+        # Served as a static file and fetched by the browser only when scrolled into view
+        parts.append(
+            f'<img class="product-image" src="{esc(product["image_url"])}" alt="{esc(product["name"])}" '
+            'width="320" height="320" loading="lazy" decoding="async">'
+        )
+    else:
+        parts.append(f'<div class="product-emoji">{esc(product["emoji"])}</div>')
+
+    tags = "".join(f'<span class="product-tag">{esc(tag)}</span>' for tag in product.get("tags", ()))
+    parts.append(
+        '<div class="card-row"><div>'
+        f'<div class="product-title">{esc(product["name"])}</div>'
+        f'<div class="product-tags">{tags}</div>'
+        f'<div class="rating">{star_string(product["rating"])} {product["rating"]}</div>'
+        '</div>'
+        f'<div class="product-category {category_class(product["category"])}">{esc(product["category"])}</div>'
+        '</div>'
+    )
+
+    # &#36; rather than "$" so markdown never reads two prices as inline math
+    price = f'<span class="product-price">&#36;{product["price"]:.2f}</span>'
+    if product.get("on_sale", False) and product.get("original_price"):
+        price += f'<br><span class="original-price">&#36;{product["original_price"]:.2f}</span>'
+    stock = product["stock"]
+    if stock > 10:
+        stock_html = f'<div class="stock stock-high">✅ {stock} left</div>'
+    elif stock > 0:
+        stock_html = f'<div class="stock stock-low">⚠️ {stock} left</div>'
+    else:
+        stock_html = '<div class="stock stock-out">❌ Out of stock</div>'
+    parts.append(f'<div class="card-row"><div>{price}</div>{stock_html}</div>')
+    parts.append('</div>')
+    return "".join(parts)
+
+
+def render_details_html(product):
+    """Description, rating bar and reviews for the details expander"""
+    esc = html.escape
+    reviews = "".join(
+        f'<div class="review"><strong>{esc(review["user"])}</strong> ({"⭐" * review["rating"]})'
+        f'<div class="review-comment">{esc(review["comment"])}</div></div>'
+        for review in REVIEWS
+    )
+    image = ""
+    if product.get("detail_image_url"):
+        image = (f'<img class="product-detail-image" src="{esc(product["detail_image_url"])}" '
+                 f'alt="{esc(product["name"])}" loading="lazy" decoding="async">')
+    return (
+        f'{image}'
+        f'<p>{esc(product["description"])}</p>'
+        f'<div class="rating-bar"><div style="width: {product["rating"] / 5:.0%}"></div></div>'
+        f'<div class="rating-bar-label">Rating: {product["rating"]}/5</div>'
+        f'{reviews}'
+    )
+
+
+class CardRenderer:
+    """LRU memo of card HTML keyed by (product id, product version) - shared by all sessions"""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, render, product):
+        with self._lock:
+            block = self._cache.get(key)
+            if block is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return block
+            self.misses += 1
+        block = render(product)
+        with self._lock:
+            self._cache[key] = block
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return block
+
+    def card(self, product, version):
+        """Static card HTML"""
+        return self._get(("card", product["id"], version), render_card_html, product)
+
+    def details(self, product, version):
+        """Details expander HTML"""
+        return self._get(("details", product["id"], version), render_details_html, product)
@@ -0,0 +1,116 @@
+"""
+Shopping cart that keeps its subtotal, item count and line totals current.
+"""
+
+from array import array
+
+
+def to_cents(amount):
+    """Convert a dollar float to integer cents"""
+    return int(round(amount * 100))
+
+
+class Cart:
+    """Session cart - lines in parallel arrays, totals kept current so reads are O(1)
+
+    Carts are a handful of lines, so a C-level scan of the id array is as quick
+    as a dict lookup and the whole cart is a few hundred bytes per session.
+    """
+
+    __slots__ = ("_ids", "_quantities", "_unit_cents", "_subtotal_cents", "_count", "version")
+
+    def __init__(self):
+        self._ids = array("q")
+        self._quantities = array("i")
+        self._unit_cents = array("q")
+        self._subtotal_cents = 0
+        self._count = 0
+        self.version = 0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __bool__(self):
+        return bool(self._ids)
+
+    def __contains__(self, product_id):
+        return product_id in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def _index(self, product_id):
+        try:
+            return self._ids.index(product_id)
+        except ValueError:
+            return -1
+
+    def _set_line(self, product_id, quantity, unit_cents):
+        """Replace one line and adjust the running totals"""
+        index = self._index(product_id)
+        old_quantity, old_cents = 0, 0
+        if index >= 0:
+            old_quantity = self._quantities[index]
+            old_cents = self._unit_cents[index] * old_quantity
+        if quantity > 0:
+            if index >= 0:
+                self._quantities[index] = quantity
+                self._unit_cents[index] = unit_cents
+            else:
+                self._ids.append(product_id)
+                self._quantities.append(quantity)
+                self._unit_cents.append(unit_cents)
+        elif index >= 0:
+            del self._ids[index], self._quantities[index], self._unit_cents[index]
+        self._count += quantity - old_quantity
+        self._subtotal_cents += unit_cents * quantity - old_cents
+        self.version += 1
+
+    def add(self, product, quantity=1):
+        """Add quantity of a product"""
+        product_id = product["id"]
+        self._set_line(product_id, self.quantity(product_id) + quantity, to_cents(product["price"]))
+
+    def remove(self, product_id):
+        """Remove a whole line, returns True if it was in the cart"""
+        if product_id not in self._ids:
+            return False
+        self._set_line(product_id, 0, 0)
+        return True
+
+    def clear(self):
+        """Empty the cart"""
+        del self._ids[:], self._quantities[:], self._unit_cents[:]
+        self._subtotal_cents = 0
+        self._count = 0
+        self.version += 1
+
+    def items(self):
+        """(product_id, quantity) pairs"""
+        return list(zip(self._ids, self._quantities))
+
+    def quantity(self, product_id):
+        """Quantity of a product in the cart"""
+        index = self._index(product_id)
+        return self._quantities[index] if index >= 0 else 0
+
+    def line_total(self, product_id):
+        """Line total in dollars"""
+        index = self._index(product_id)
+        return self._unit_cents[index] * self._quantities[index] / 100 if index >= 0 else 0.0
+
+    @property
+    def subtotal_cents(self):
+        return self._subtotal_cents
+
+    @property
+    def subtotal(self):
+        return self._subtotal_cents / 100
+
+    @property
+    def count(self):
+        return self._count
+
+    def to_dict(self):
+        """Plain product_id -> quantity copy, e.g. for an order record"""
+        return dict(zip(self._ids, self._quantities))
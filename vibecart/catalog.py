@@ -0,0 +1,107 @@
+"""
+In-memory product catalog with hash indexes for id, category, sale and tag lookups.
+
+The app reads the SQLite CatalogRepository (vibecart.catalog_db); this class
+is kept only as the indexed in-memory baseline for benchmarks/bench_catalog.py.
+"""
+
+
+class ProductCatalog:
+    """Indexed product collection - every lookup is a dict hit, not a list scan"""
+
+    def __init__(self, products=()):
+        self._by_id = {}
+        self._by_category = {}
+        self._by_tag = {}
+        self._on_sale = {}
+        self._versions = {}
+        self.version = 0
+        for product in products:
+            self._index(product)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __contains__(self, product_id):
+        return product_id in self._by_id
+
+    def _index(self, product):
+        """Add product to every index"""
+        product_id = product["id"]
+        self._by_id[product_id] = product
+        self._versions[product_id] = self.version
+        self._by_category.setdefault(product["category"], {})[product_id] = product
+        for tag in product.get("tags", ()):
+            self._by_tag.setdefault(tag, {})[product_id] = product
+        if product.get("on_sale", False):
+            self._on_sale[product_id] = product
+
+    def _unindex(self, product):
+        """Drop product from every index"""
+        product_id = product["id"]
+        del self._by_id[product_id]
+        bucket = self._by_category[product["category"]]
+        del bucket[product_id]
+        if not bucket:
+            del self._by_category[product["category"]]
+        for tag in product.get("tags", ()):
+            bucket = self._by_tag[tag]
+            del bucket[product_id]
+            if not bucket:
+                del self._by_tag[tag]
+        self._on_sale.pop(product_id, None)
+        self._versions.pop(product_id, None)
+
+    def upsert(self, product):
+        """Insert or replace a product and bump the catalog version"""
+        existing = self._by_id.get(product["id"])
+        if existing is not None:
+            self._unindex(existing)
+        self.version += 1
+        self._index(product)
+
+    def remove(self, product_id):
+        """Remove a product if present"""
+        existing = self._by_id.get(product_id)
+        if existing is not None:
+            self._unindex(existing)
+            self.version += 1
+
+    def get(self, product_id, default=None):
+        """Get product by ID"""
+        return self._by_id.get(product_id, default)
+
+    def version_of(self, product_id):
+        """Catalog version at which a product last changed"""
+        return self._versions.get(product_id)
+
+    def all(self):
+        """All products in insertion order"""
+        return list(self._by_id.values())
+
+    def in_category(self, category):
+        """Products in a category"""
+        return list(self._by_category.get(category, {}).values())
+
+    def with_tag(self, tag):
+        """Products carrying a tag"""
+        return list(self._by_tag.get(tag, {}).values())
+
+    def on_sale(self):
+        """Products currently on sale"""
+        return list(self._on_sale.values())
+
+    def sale_count(self):
+        """Number of products on sale"""
+        return len(self._on_sale)
+
+    def categories(self):
+        """Category names in first-seen order"""
+        return list(self._by_category)
+
+    def tags(self):
+        """Tag names in first-seen order"""
+        return list(self._by_tag)
@@ -0,0 +1,345 @@
+"""
+SQLite-backed catalog repository with a process-wide connection pool.
+
+The catalog the app reads: lookups by id, category, tag and sale, plus
+query()/count() so the grid can filter, sort and paginate in SQL instead of
+in Python, and scan() for streaming the whole table.
+"""
+
+import json
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    price REAL NOT NULL,
+    category TEXT NOT NULL,
+    emoji TEXT NOT NULL DEFAULT '🛍️',
+    description TEXT NOT NULL DEFAULT '',
+    rating REAL NOT NULL DEFAULT 0,
+    stock INTEGER NOT NULL DEFAULT 0,
+    image_color TEXT,
+    on_sale INTEGER NOT NULL DEFAULT 0,
+    original_price REAL,
+    tags TEXT NOT NULL DEFAULT '[]',
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_products_category_price ON products (category, price);
+CREATE INDEX IF NOT EXISTS idx_products_category_rating ON products (category, rating);
+CREATE INDEX IF NOT EXISTS idx_products_on_sale ON products (on_sale, price);
+CREATE INDEX IF NOT EXISTS idx_products_on_sale_rating ON products (on_sale, rating);
+CREATE INDEX IF NOT EXISTS idx_products_price ON products (price);
+CREATE INDEX IF NOT EXISTS idx_products_rating ON products (rating);
+CREATE TABLE IF NOT EXISTS product_tags (
+    tag TEXT NOT NULL,
+    product_id INTEGER NOT NULL REFERENCES products (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, product_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_product_tags_product ON product_tags (product_id);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO catalog_meta (key, value) VALUES ('version', 0);
+INSERT OR IGNORE INTO catalog_meta (key, value) SELECT 'revision', value FROM catalog_meta WHERE key = 'version';
+"""
+
+COLUMNS = ("id", "name", "price", "category", "emoji", "description", "rating",
+           "stock", "image_color", "on_sale", "original_price", "tags", "version")
+SELECT_PRODUCTS = f"SELECT {', '.join(COLUMNS)} FROM products"
+# Update in place on conflict - unlike INSERT OR REPLACE this does not delete and
+# re-add the row, so indexes on unchanged columns are left alone
+UPSERT_PRODUCT = (
+    f"INSERT INTO products ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+    f"ON CONFLICT (id) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in COLUMNS[1:])}"
+)
+
+# Distinct values by hopping along an index - O(distinct * log n), not a full scan
+DISTINCT_VALUES = """
+WITH RECURSIVE hop(value) AS (
+    SELECT MIN({column}) FROM {table}
+    UNION ALL
+    SELECT (SELECT MIN({column}) FROM {table} WHERE {column} > hop.value) FROM hop WHERE hop.value IS NOT NULL
+)
+SELECT value FROM hop WHERE value IS NOT NULL
+"""
+
+# Sort keys understood by query(); ties always break on id so pages are stable
+SORTS = {
+    "id": "id",
+    "-id": "id DESC",
+    "price": "price, id",
+    "-price": "price DESC, id",
+    "-rating": "rating DESC, id",
+}
+
+
+def row_to_product(row):
+    """Turn a products row into the dict shape the app uses"""
+    product = {
+        "id": row[0],
+        "name": row[1],
+        "price": row[2],
+        "category": row[3],
+        "emoji": row[4],
+        "description": row[5],
+        "rating": row[6],
+        "stock": row[7],
+        "image_color": row[8],
+        "on_sale": bool(row[9]),
+        "tags": json.loads(row[11]),
+        "version": row[12],
+    }
+    if row[10] is not None:
+        product["original_price"] = row[10]
+    return product
+
+
+def product_to_row(product, version):
+    """Turn a product dict into a products row"""
+    return (
+        product["id"], product["name"], product["price"], product["category"],
+        product.get("emoji", "🛍️"), product.get("description", ""), product.get("rating", 0),
+        product.get("stock", 0), product.get("image_color"), int(bool(product.get("on_sale", False))),
+        product.get("original_price"), json.dumps(product.get("tags", []), ensure_ascii=False), version,
+    )
+
+
+def _bump_revision(conn, publish=True):
+    """Next catalog revision inside a write transaction, published as the version unless told not to"""
+    conn.execute("UPDATE catalog_meta SET value = value + 1 WHERE key = 'revision'")
+    revision = conn.execute("SELECT value FROM catalog_meta WHERE key = 'revision'").fetchone()[0]
+    if publish:
+        conn.execute("UPDATE catalog_meta SET value = ? WHERE key = 'version'", (revision,))
+    return revision
+
+
+def rollback(conn):
+    """Roll back whatever transaction conn is in, if any"""
+    if conn.in_transaction:
+        conn.execute("ROLLBACK")
+
+
+class ConnectionPool:
+    """Fixed set of SQLite connections shared by every session in the process"""
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self._idle = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(self._connect())
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, blocking while all are in use"""
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Borrow a connection inside BEGIN IMMEDIATE ... COMMIT"""
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                # Also reached when COMMIT itself fails (e.g. database is locked) -
+                # the connection must never go back to the pool mid-transaction
+                rollback(conn)
+                raise
+
+    def close(self):
+        """Close every idle connection"""
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+def _where(category=None, on_sale=None, price_min=None, price_max=None, min_rating=None):
+    """WHERE clause and parameters for the supported filters"""
+    clauses, params = [], []
+    if category is not None:
+        clauses.append("category = ?")
+        params.append(category)
+    if on_sale is not None:
+        clauses.append("on_sale = ?")
+        params.append(int(on_sale))
+    if price_min is not None:
+        clauses.append("price >= ?")
+        params.append(price_min)
+    if price_max is not None:
+        clauses.append("price <= ?")
+        params.append(price_max)
+    if min_rating is not None:
+        clauses.append("rating >= ?")
+        params.append(min_rating)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+class CatalogRepository:
+    """Product catalog stored in SQLite, read through a shared connection pool"""
+
+    def __init__(self, path, pool_size=4):
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _fetch(self, sql, params=()):
+        with self.pool.connection() as conn:
+            return [row_to_product(row) for row in conn.execute(sql, params)]
+
+    def _scalar(self, sql, params=()):
+        with self.pool.connection() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    def __len__(self):
+        return self._scalar("SELECT COUNT(*) FROM products")
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def __contains__(self, product_id):
+        return self.get(product_id) is not None
+
+    @property
+    def version(self):
+        """Published catalog version - what derived views (search, facets, ...) are keyed on"""
+        return self._scalar("SELECT value FROM catalog_meta WHERE key = 'version'")
+
+    @property
+    def revision(self):
+        """Bumped by every committed write, published or not - for keys that must follow live rows"""
+        return self._scalar("SELECT value FROM catalog_meta WHERE key = 'revision'")
+
+    def version_of(self, product_id):
+        """Catalog revision at which a product last changed"""
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT version FROM products WHERE id = ?", (product_id,)).fetchone()
+        return row[0] if row else None
+
+    def get(self, product_id, default=None):
+        """Get product by ID"""
+        rows = self._fetch(f"{SELECT_PRODUCTS} WHERE id = ?", (product_id,))
+        return rows[0] if rows else default
+
+    def get_many(self, product_ids):
+        """Products for a list of ids, in the order given, skipping unknown ids"""
+        product_ids = list(product_ids)
+        if not product_ids:
+            return []
+        found = {}
+        for start in range(0, len(product_ids), 500):
+            chunk = product_ids[start:start + 500]
+            marks = ", ".join("?" * len(chunk))
+            for product in self._fetch(f"{SELECT_PRODUCTS} WHERE id IN ({marks})", chunk):
+                found[product["id"]] = product
+        return [found[pid] for pid in product_ids if pid in found]
+
+    def all(self):
+        """All products in id order"""
+        return self._fetch(f"{SELECT_PRODUCTS} ORDER BY id")
+
+    def scan(self, batch_size=1000):
+        """Yield every product in id order, reading batch_size rows per query"""
+        last_id = -(1 << 63)
+        while True:
+            # Keyset paging, a connection per batch - a slow consumer never pins one
+            rows = self._fetch(f"{SELECT_PRODUCTS} WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size))
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1]["id"]
+
+    def in_category(self, category):
+        """Products in a category"""
+        return self.query(category=category)
+
+    def with_tag(self, tag):
+        """Products carrying a tag"""
+        return self._fetch(
+            f"{SELECT_PRODUCTS} WHERE id IN (SELECT product_id FROM product_tags WHERE tag = ?) ORDER BY id",
+            (tag,),
+        )
+
+    def on_sale(self):
+        """Products currently on sale"""
+        return self.query(on_sale=True)
+
+    def sale_count(self):
+        """Number of products on sale"""
+        return self.count(on_sale=True)
+
+    def categories(self):
+        """Category names, alphabetical"""
+        with self.pool.connection() as conn:
+            return [row[0] for row in conn.execute(DISTINCT_VALUES.format(column="category", table="products"))]
+
+    def tags(self):
+        """Tag names, alphabetical"""
+        with self.pool.connection() as conn:
+            return [row[0] for row in conn.execute(DISTINCT_VALUES.format(column="tag", table="product_tags"))]
+
+    def query(self, sort="id", limit=None, offset=0, **filters):
+        """Filtered, sorted slice of the catalog"""
+        where, params = _where(**filters)
+        sql = f"{SELECT_PRODUCTS}{where} ORDER BY {SORTS[sort]}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return self._fetch(sql, params)
+
+    def count(self, **filters):
+        """Number of products matching the filters"""
+        where, params = _where(**filters)
+        return self._scalar(f"SELECT COUNT(*) FROM products{where}", params)
+
+    def upsert_many(self, products, conn=None, publish=True):
+        """Insert or replace products in one transaction, returns the new catalog revision
+
+        Rows are stamped with a fresh revision, so per-product keys move with
+        every write. With publish=False the catalog version is left alone until
+        publish() - bulk imports use this so many batches cost one rebuild of
+        the derived views.
+        """
+        if conn is None:
+            with self.pool.transaction() as conn:
+                return self.upsert_many(products, conn, publish)
+        revision = _bump_revision(conn, publish)
+        products = list(products)
+        # One statement each for the whole batch - bulk imports call this with thousands of rows
+        conn.executemany(UPSERT_PRODUCT, [product_to_row(product, revision) for product in products])
+        conn.executemany("DELETE FROM product_tags WHERE product_id = ?",
+                         [(product["id"],) for product in products])
+        conn.executemany("INSERT OR IGNORE INTO product_tags (tag, product_id) VALUES (?, ?)",
+                         [(tag, product["id"]) for product in products for tag in product.get("tags", [])])
+        return revision
+
+    def publish(self):
+        """Make every committed write visible to version-keyed caches, returns the catalog version"""
+        with self.pool.transaction() as conn:
+            conn.execute("UPDATE catalog_meta SET value = (SELECT value FROM catalog_meta WHERE key = 'revision') "
+                         "WHERE key = 'version'")
+            return conn.execute("SELECT value FROM catalog_meta WHERE key = 'version'").fetchone()[0]
+
+    def upsert(self, product):
+        """Insert or replace one product"""
+        return self.upsert_many([product])
+
+    def remove(self, product_id):
+        """Remove a product if present"""
+        with self.pool.transaction() as conn:
+            if conn.execute("DELETE FROM products WHERE id = ?", (product_id,)).rowcount:
+                _bump_revision(conn)
@@ -0,0 +1,64 @@
+"""
+Columnar catalog view - NumPy arrays per field with precomputed sort orders.
+
+Rows are products in id order. Filter-then-sort is a boolean mask plus an
+index gather over a precomputed order, yielding row numbers; only the rows
+that end up on screen are ever turned back into product dicts.
+"""
+
+import numpy as np
+
+class ColumnarCatalog:
+    """id, price, rating, stock, category code, on-sale and tag columns"""
+
+    def __init__(self, products):
+        products = sorted(products, key=lambda p: p["id"])
+        self.size = len(products)
+        self.ids = np.array([p["id"] for p in products], dtype=np.int64)
+        self.prices = np.array([p["price"] for p in products], dtype=np.float64)
+        self.ratings = np.array([p["rating"] for p in products], dtype=np.float64)
+        self.stock = np.array([p["stock"] for p in products], dtype=np.int32)
+        self.on_sale = np.array([p.get("on_sale", False) for p in products], dtype=bool)
+        self.categories = sorted({p["category"] for p in products})
+        codes = {name: code for code, name in enumerate(self.categories)}
+        self.category_codes = np.array([codes[p["category"]] for p in products], dtype=np.int16)
+        self.tags = [tuple(p.get("tags", ())) for p in products]
+
+        # Sort keys match CatalogRepository.query(); ties always break on id
+        rows = np.arange(self.size)
+        self.orders = {
+            "id": rows,
+            "-id": rows[::-1].copy(),
+            "price": np.lexsort((rows, self.prices)),
+            "-price": np.lexsort((rows, -self.prices)),
+            "-rating": np.lexsort((rows, -self.ratings)),
+        }
+
+    def __len__(self):
+        return self.size
+
+    def rows_of(self, product_ids):
+        """Row index for each product id, -1 where unknown"""
+        product_ids = np.fromiter(product_ids, dtype=np.int64)
+        if not self.size:
+            return np.full(len(product_ids), -1)
+        rows = np.minimum(np.searchsorted(self.ids, product_ids), self.size - 1)
+        return np.where(self.ids[rows] == product_ids, rows, -1)
+
+    def price_mask(self, low=None, high=None):
+        """Rows priced within [low, high]"""
+        mask = np.ones(self.size, dtype=bool)
+        if low is not None:
+            mask &= self.prices >= low
+        if high is not None:
+            mask &= self.prices <= high
+        return mask
+
+    def sorted_rows(self, mask, sort_key="id"):
+        """Rows where mask is set, in sort_key order"""
+        order = self.orders[sort_key]
+        return order[mask[order]]
+
+    def ids_of(self, rows):
+        """Product ids for rows, as plain ints"""
+        return self.ids[rows].tolist()
@@ -0,0 +1,73 @@
+"""
+Clickstream events - recorded in memory, written to JSONL by a background thread.
+
+record() only appends a tuple to a deque (atomic, no lock), so the request
+path does no I/O, JSON encoding or thread signalling. Every flush_interval the
+writer drains the deque and appends it with one write per batch. If the
+writer falls behind and the buffer fills, events are dropped and counted
+rather than slowing sessions down.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+DEFAULT_EVENTS_PATH = os.environ.get("VIBECART_EVENTS", os.path.join("data", "events.jsonl"))
+
+
+class EventLog:
+    """Buffered append-only JSONL sink for user events"""
+
+    def __init__(self, path, flush_interval=0.5, max_batch=2000, max_buffer=100_000):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_buffer = max_buffer
+        self.recorded = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self._buffer = deque()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, event, session_id, **fields):
+        """Buffer one event - never blocks"""
+        if len(self._buffer) >= self.max_buffer:
+            self.dropped += 1
+            return
+        self._buffer.append((time.time(), event, session_id, fields))
+        self.recorded += 1
+
+    def _run(self):
+        with open(self.path, "a", encoding="utf-8") as sink:
+            while not self._stopping.wait(self.flush_interval):
+                self._drain(sink)
+            self._drain(sink)
+
+    def _drain(self, sink):
+        while self._buffer:
+            batch = []
+            try:
+                for _ in range(self.max_batch):
+                    batch.append(self._buffer.popleft())
+            except IndexError:
+                pass
+            sink.write("".join(
+                json.dumps({"ts": ts, "event": event, "session": session_id, **fields}) + "\n"
+                for ts, event, session_id, fields in batch
+            ))
+            sink.flush()
+            self.written += len(batch)
+            self.batches += 1
+
+    def close(self):
+        """Write everything buffered so far and stop the writer"""
+        self._stopping.set()
+        self._thread.join()
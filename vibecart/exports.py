@@ -0,0 +1,179 @@
+"""
+Catalog feed and order export - CSV or JSONL, optionally gzipped, streamed.
+
+Rows are read from the database a batch at a time (keyset paging), formatted
+and encoded as they arrive, so an export holds one batch and one gzip window
+however many rows it covers. The catalog CSV uses the same columns and "|"
+tag separator the bulk importer reads, so a feed round-trips.
+
+    python -m vibecart.exports catalog [--format csv|jsonl] [--gzip] [--out catalog.csv]
+    python -m vibecart.exports orders --format jsonl --gzip --out orders.jsonl.gz
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+import zlib
+
+from vibecart.orders import DEFAULT_ORDERS_DB_PATH, OrderStore
+from vibecart.seed import DEFAULT_DB_PATH, open_catalog
+
+PRODUCT_FIELDS = ("id", "name", "price", "category", "emoji", "description", "rating",
+                  "stock", "image_color", "on_sale", "original_price", "tags")
+ORDER_FIELDS = ("order_id", "customer_id", "created_at", "total", "item_count", "items")
+
+FORMATS = ("csv", "jsonl")
+MIME_TYPES = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+# Rows formatted per chunk - one chunk is one write / one gzip call
+CHUNK_ROWS = 1000
+
+
+def product_csv_row(product):
+    return [product["id"], product["name"], product["price"], product["category"], product["emoji"],
+            product["description"], product["rating"], product["stock"], product["image_color"],
+            "true" if product["on_sale"] else "false", product.get("original_price"),
+            "|".join(product["tags"])]
+
+
+def order_csv_row(order):
+    return [order["order_id"], order["customer_id"], order["created_at"], order["total"],
+            order["item_count"], json.dumps(order["items"], separators=(",", ":"))]
+
+
+class ExportStats:
+    """Rows and bytes produced by one export, for throughput reporting"""
+
+    def __init__(self):
+        self.rows = 0
+        self.bytes = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def summary(self):
+        return (f"{self.rows:,} rows, {self.bytes / 2**20:.1f} MB in {self.seconds:.2f} s "
+                f"({self.rows_per_second:,.0f} rows/s, {self.bytes / 2**20 / (self.seconds or 1):.1f} MB/s)")
+
+
+def csv_chunks(rows, fields, to_row, stats):
+    """Header then CHUNK_ROWS rows at a time as CSV text"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    pending = 0
+    for row in rows:
+        writer.writerow(to_row(row))
+        stats.rows += 1
+        pending += 1
+        if pending == CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+def jsonl_chunks(rows, fields, stats):
+    """CHUNK_ROWS rows at a time as JSON lines, keeping only the exported fields"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({field: row[field] for field in fields if field in row}, ensure_ascii=False))
+        stats.rows += 1
+        if len(lines) == CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def encode(chunks, compress, stats):
+    """UTF-8 bytes of each text chunk, through a streaming gzip compressor if asked"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            stats.bytes += len(data)
+            stats.seconds = time.perf_counter() - stats.started
+            yield data
+    if compressor is not None:
+        data = compressor.flush()
+        stats.bytes += len(data)
+        yield data
+    stats.seconds = time.perf_counter() - stats.started
+
+
+def export_catalog(repository, fmt="csv", compress=False, stats=None):
+    """Yield the whole catalog as encoded bytes"""
+    stats = stats if stats is not None else ExportStats()
+    products = repository.scan()
+    if fmt == "csv":
+        chunks = csv_chunks(products, PRODUCT_FIELDS, product_csv_row, stats)
+    else:
+        chunks = jsonl_chunks(products, PRODUCT_FIELDS, stats)
+    return encode(chunks, compress, stats)
+
+
+def export_orders(order_store, fmt="csv", compress=False, stats=None):
+    """Yield every order, oldest first, as encoded bytes"""
+    stats = stats if stats is not None else ExportStats()
+    orders = order_store.scan()
+    if fmt == "csv":
+        chunks = csv_chunks(orders, ORDER_FIELDS, order_csv_row, stats)
+    else:
+        chunks = jsonl_chunks(orders, ORDER_FIELDS, stats)
+    return encode(chunks, compress, stats)
+
+
+def file_name(kind, fmt, compress):
+    return f"vibecart-{kind}.{fmt}" + (".gz" if compress else "")
+
+
+def mime_type(fmt, compress):
+    return "application/gzip" if compress else MIME_TYPES[fmt]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the VibeCart catalog or order history")
+    parser.add_argument("kind", choices=["catalog", "orders"])
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--gzip", action="store_true", help="gzip the output")
+    parser.add_argument("--out", help="output file (default: vibecart-<kind>.<format>[.gz]; - for stdout)")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="catalog database path")
+    parser.add_argument("--orders-db", default=DEFAULT_ORDERS_DB_PATH, help="orders database path")
+    args = parser.parse_args()
+
+    if args.kind == "catalog":
+        source = open_catalog(args.db)
+        close = source.pool.close
+        export = export_catalog
+    else:
+        source = OrderStore(args.orders_db)
+        close = source.close
+        export = export_orders
+
+    out_path = args.out or file_name(args.kind, args.format, args.gzip)
+    stats = ExportStats()
+    try:
+        out = sys.stdout.buffer if out_path == "-" else open(out_path, "wb")
+        try:
+            for data in export(source, args.format, args.gzip, stats):
+                out.write(data)
+        finally:
+            if out is not sys.stdout.buffer:
+                out.close()
+    finally:
+        close()
+    print(f"{out_path}: {stats.summary()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
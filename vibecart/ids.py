@@ -0,0 +1,49 @@
+"""
+Time-ordered unique IDs - Snowflake-style millisecond time, worker and sequence.
+
+An ID is 24 upper-case hex digits: 48 bits of Unix time in milliseconds, a
+16-bit worker id for the server process and a 32-bit sequence. The fields are
+fixed width, so sorting ID strings sorts by creation time and a range of IDs
+is a time range.
+
+The sequence is an itertools.count, which hands out each number exactly once
+across threads without a lock; it never resets, and starts below 2**24 so it
+won't wrap for billions of IDs. Each process picks a random worker id and
+sequence start, or set VIBECART_WORKER_ID to pin one worker id per process.
+"""
+
+import itertools
+import os
+import secrets
+import time
+
+WORKER_BITS = 16
+SEQUENCE_BITS = 32
+_SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+
+
+def default_worker_id():
+    """Worker id from VIBECART_WORKER_ID, else a random one for this process"""
+    worker_id = os.environ.get("VIBECART_WORKER_ID")
+    if worker_id is not None:
+        return int(worker_id) % (1 << WORKER_BITS)
+    return secrets.randbits(WORKER_BITS)
+
+
+class IdGenerator:
+    """Thread-safe source of unique, time-sortable ID strings"""
+
+    def __init__(self, prefix="", worker_id=None):
+        self.prefix = prefix
+        self.worker_id = default_worker_id() if worker_id is None else worker_id
+        self._worker = f"{self.worker_id:04X}"
+        self._sequence = itertools.count(secrets.randbits(24))
+
+    def __call__(self):
+        """A new ID"""
+        sequence = next(self._sequence) & _SEQUENCE_MASK
+        return f"{self.prefix}{time.time_ns() // 1_000_000:012X}{self._worker}{sequence:08X}"
+
+    def timestamp_of(self, generated_id):
+        """Unix time in seconds at which an ID was generated"""
+        return int(generated_id[len(self.prefix):len(self.prefix) + 12], 16) / 1000
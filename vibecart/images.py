@@ -0,0 +1,189 @@
+"""
+Product images - source files resized once into a content-addressed thumbnail cache.
+
+Sources live in one directory named by product id (images/12.jpg). Each size
+is rendered once to <cache_dir>/<digest[:2]>/<digest>-<size>.<ext>, where
+digest hashes the source bytes, so a changed image gets a new URL and an
+unchanged one is never decoded again. Thumbnails are served as static files
+and shown with <img loading="lazy">, so no image bytes go through session
+state or the websocket, and the server holds no decoded images.
+
+    python -m vibecart.images          # pre-render every size for every source image
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+DEFAULT_IMAGE_DIR = os.environ.get("VIBECART_IMAGES", "images")
+# Streamlit serves ./static at app/static when server.enableStaticServing is on
+DEFAULT_THUMB_DIR = os.path.join("static", "thumbs")
+DEFAULT_URL_PREFIX = "app/static/thumbs"
+
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"}
+
+# (width, height, crop) - cards crop to fill a square, details keep the whole picture
+SIZES = {
+    "card": (320, 320, True),
+    "detail": (800, 800, False),
+}
+
+# Refuse to decode anything bigger - bounds the memory one resize can take
+MAX_SOURCE_PIXELS = 40_000_000
+
+_FAILED = object()
+
+
+def file_digest(path):
+    """sha256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:24]
+
+
+def render_thumbnail(source_path, dest_path, size, image_format):
+    """Decode, orient, resize and encode one thumbnail, written atomically"""
+    width, height, crop = SIZES[size]
+    with Image.open(source_path) as image:
+        if image.width * image.height > MAX_SOURCE_PIXELS:
+            raise ValueError(f"{source_path} is larger than {MAX_SOURCE_PIXELS} pixels")
+        # JPEG sources decode straight at a reduced scale, not full size then shrink
+        image.draft("RGB", (width, height))
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        if crop:
+            image = ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+        else:
+            image = ImageOps.contain(image, (width, height), Image.Resampling.LANCZOS)
+
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dest_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            if image_format == "WEBP":
+                image.save(out, "WEBP", quality=80, method=4)
+            else:
+                image.save(out, "PNG", optimize=True)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class ImageStore:
+    """Maps product ids to thumbnail URLs, rendering each (image, size) once"""
+
+    def __init__(self, source_dir=DEFAULT_IMAGE_DIR, cache_dir=DEFAULT_THUMB_DIR,
+                 url_prefix=DEFAULT_URL_PREFIX, max_entries=8192, rescan_interval=2.0):
+        self.source_dir = source_dir
+        self.cache_dir = cache_dir
+        self.url_prefix = url_prefix
+        self.max_entries = max_entries
+        self.rescan_interval = rescan_interval
+        self.image_format = "WEBP" if features.check("webp") else "PNG"
+        self.extension = self.image_format.lower()
+        self.rendered = 0
+        self._sources = {}
+        self._scanned_mtime = None
+        self._checked_at = 0.0
+        self._urls = OrderedDict()
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+
+    def _scan(self):
+        """Re-index the source directory if it changed, at most every rescan_interval"""
+        now = time.monotonic()
+        if now - self._checked_at < self.rescan_interval:
+            return
+        self._checked_at = now
+        try:
+            mtime = os.stat(self.source_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._sources = {}
+            return
+        if mtime == self._scanned_mtime:
+            return
+        sources = {}
+        with os.scandir(self.source_dir) as entries:
+            for entry in entries:
+                stem, extension = os.path.splitext(entry.name)
+                if stem.isdigit() and extension.lower() in SOURCE_EXTENSIONS and entry.is_file():
+                    stat = entry.stat()
+                    sources[int(stem)] = (entry.path, stat.st_mtime_ns, stat.st_size)
+        self._sources = sources
+        self._scanned_mtime = mtime
+
+    def has_image(self, product_id):
+        self._scan()
+        return product_id in self._sources
+
+    def url(self, product_id, size="card"):
+        """Thumbnail URL for a product, or None if it has no usable image"""
+        self._scan()
+        source = self._sources.get(product_id)
+        if source is None:
+            return None
+        key = (product_id, size, source[1], source[2])
+        with self._lock:
+            cached = self._urls.get(key)
+            if cached is not None:
+                self._urls.move_to_end(key)
+                return None if cached is _FAILED else cached
+
+        try:
+            url = self._ensure(source[0], size)
+        except (OSError, ValueError, UnidentifiedImageError, Image.DecompressionBombError):
+            url = _FAILED
+        with self._lock:
+            self._urls[key] = url
+            if len(self._urls) > self.max_entries:
+                self._urls.popitem(last=False)
+        return None if url is _FAILED else url
+
+    def _ensure(self, source_path, size):
+        digest = file_digest(source_path)
+        name = f"{digest}-{size}.{self.extension}"
+        dest_path = os.path.join(self.cache_dir, digest[:2], name)
+        if not os.path.exists(dest_path):
+            with self._render_lock:
+                if not os.path.exists(dest_path):
+                    render_thumbnail(source_path, dest_path, size, self.image_format)
+                    self.rendered += 1
+        return f"{self.url_prefix}/{digest[:2]}/{name}"
+
+    def build_all(self):
+        """Render every size of every source image, returns (images, failures)"""
+        self._checked_at = 0.0
+        self._scan()
+        failures = 0
+        for product_id in sorted(self._sources):
+            for size in SIZES:
+                if self.url(product_id, size) is None:
+                    failures += 1
+        return len(self._sources), failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render product thumbnails")
+    parser.add_argument("--source", default=DEFAULT_IMAGE_DIR)
+    parser.add_argument("--cache", default=DEFAULT_THUMB_DIR)
+    args = parser.parse_args()
+
+    store = ImageStore(args.source, args.cache)
+    start = time.perf_counter()
+    images, failures = store.build_all()
+    print(f"{images} images, {store.rendered} thumbnails rendered, {failures} failed "
+          f"in {time.perf_counter() - start:.2f} s ({store.image_format})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Bulk catalog import - stream a CSV or JSONL vendor feed into the catalog.
+
+Rows are read one at a time, validated against the product schema and
+upserted in batches of batch_size per transaction, so memory is bounded by
+one batch whatever the size of the feed. Each batch gets its own catalog
+revision, so cards and cart totals follow the rows as they land, but the
+catalog version is published once, when the import ends, so the live app
+rebuilds its derived views once rather than after every batch. Rejected rows
+are counted by reason, the first few kept for the report, and optionally all
+written to a JSONL rejects file with their line number and error.
+
+    python -m vibecart.importer feed.csv [--db data/vibecart.db] [--batch-size 5000] [--rejects rejects.jsonl]
+
+CSV tags are separated by "|" (or given as a JSON list); .gz feeds are read
+as they are decompressed.
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import math
+import sqlite3
+import time
+from collections import Counter
+
+from vibecart.seed import DEFAULT_DB_PATH, open_catalog
+
+TRUE_WORDS = {"1", "true", "yes", "y", "t"}
+FALSE_WORDS = {"0", "false", "no", "n", "f", ""}
+
+# SQLite INTEGER is a signed 64-bit value; anything outside would fail the whole batch
+MIN_INTEGER = -(2 ** 63)
+MAX_INTEGER = 2 ** 63 - 1
+
+MAX_TEXT_LENGTH = 2000
+MAX_TAGS = 20
+
+
+class RowError(ValueError):
+    """A feed row that does not fit the product schema"""
+
+
+def _text(raw, field, required=False, default=None):
+    value = raw.get(field)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        if required:
+            raise RowError(f"missing {field}")
+        return default
+    if not isinstance(value, str):
+        raise RowError(f"{field} must be text")
+    value = value.strip()
+    if len(value) > MAX_TEXT_LENGTH:
+        raise RowError(f"{field} longer than {MAX_TEXT_LENGTH} characters")
+    return value
+
+
+def _number(raw, field, required=False, default=None):
+    value = raw.get(field)
+    if value is None or value == "":
+        if required:
+            raise RowError(f"missing {field}")
+        return default
+    if isinstance(value, bool):
+        raise RowError(f"{field} must be a number")
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise RowError(f"{field} must be a number") from None
+    if not math.isfinite(value):
+        raise RowError(f"{field} must be finite")
+    return value
+
+
+def _integer(raw, field, required=False, default=None):
+    value = raw.get(field)
+    if isinstance(value, str):
+        value = value.strip()
+    if value is None or value == "":
+        if required:
+            raise RowError(f"missing {field}")
+        return default
+    # Parsed exactly - going through float would round ids and stock above 2**53
+    if isinstance(value, bool):
+        raise RowError(f"{field} must be a whole number")
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            raise RowError(f"{field} must be a whole number") from None
+    elif isinstance(value, float):
+        if not math.isfinite(value) or not value.is_integer():
+            raise RowError(f"{field} must be a whole number")
+        value = int(value)
+    elif not isinstance(value, int):
+        raise RowError(f"{field} must be a whole number")
+    if not MIN_INTEGER <= value <= MAX_INTEGER:
+        raise RowError(f"{field} out of range")
+    return value
+
+
+def _flag(raw, field):
+    value = raw.get(field)
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    word = str(value).strip().lower()
+    if word in TRUE_WORDS:
+        return True
+    if word in FALSE_WORDS:
+        return False
+    raise RowError(f"{field} must be true or false")
+
+
+def _tags(raw):
+    value = raw.get("tags")
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith("["):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                raise RowError("tags is not a valid JSON list") from None
+        else:
+            value = value.split("|")
+    if not isinstance(value, list) or not all(isinstance(tag, str) for tag in value):
+        raise RowError("tags must be a list of text")
+    tags = list(dict.fromkeys(tag.strip() for tag in value if tag.strip()))
+    if len(tags) > MAX_TAGS:
+        raise RowError(f"more than {MAX_TAGS} tags")
+    return tags
+
+
+def validate_product(raw):
+    """Product dict for one feed row, or RowError saying why it cannot be imported"""
+    product_id = _integer(raw, "id", required=True)
+    if product_id <= 0:
+        raise RowError("id must be positive")
+    price = _number(raw, "price", required=True)
+    if price <= 0:
+        raise RowError("price must be positive")
+    stock = _integer(raw, "stock", default=0)
+    if stock < 0:
+        raise RowError("stock must not be negative")
+    rating = _number(raw, "rating", default=0.0)
+    if not 0 <= rating <= 5:
+        raise RowError("rating must be between 0 and 5")
+
+    product = {
+        "id": product_id,
+        "name": _text(raw, "name", required=True),
+        "price": round(price, 2),
+        "category": _text(raw, "category", required=True),
+        "emoji": _text(raw, "emoji", default="🛍️"),
+        "description": _text(raw, "description", default=""),
+        "rating": round(rating, 1),
+        "stock": stock,
+        "image_color": _text(raw, "image_color"),
+        "on_sale": _flag(raw, "on_sale"),
+        "tags": _tags(raw),
+    }
+    if product["on_sale"]:
+        original_price = _number(raw, "original_price")
+        if original_price is None:
+            raise RowError("on_sale needs original_price")
+        if original_price <= price:
+            raise RowError("original_price must be above price")
+        product["original_price"] = round(original_price, 2)
+    return product
+
+
+def _open_text(path):
+    # utf-8-sig drops the byte order mark spreadsheet exports start with, which
+    # would otherwise end up in the first CSV header ("\ufeffid")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, encoding="utf-8-sig", newline="")
+
+
+def read_csv(path):
+    """Yield (line number, row dict) from a CSV feed with a header row"""
+    with _open_text(path) as feed:
+        reader = csv.DictReader(feed)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def read_jsonl(path):
+    """Yield (line number, row dict) from a JSONL feed; unparseable lines yield the error"""
+    with _open_text(path) as feed:
+        for line_number, line in enumerate(feed, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                row = RowError(f"invalid JSON: {exc.msg}")
+            else:
+                if not isinstance(row, dict):
+                    row = RowError("line is not a JSON object")
+            yield line_number, row
+
+
+def read_feed(path, feed_format=None):
+    """Rows of a feed, picking the reader from the format or the file extension"""
+    if feed_format is None:
+        name = path[:-3] if path.endswith(".gz") else path
+        feed_format = "jsonl" if name.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+    return read_jsonl(path) if feed_format == "jsonl" else read_csv(path)
+
+
+class ImportReport:
+    """Running totals of one import"""
+
+    def __init__(self, keep_rejects=20):
+        self.keep_rejects = keep_rejects
+        self.rows = 0
+        self.imported = 0
+        self.batches = 0
+        self.reasons = Counter()
+        self.first_rejects = []
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    @property
+    def rejected(self):
+        return sum(self.reasons.values())
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def reject(self, line_number, error):
+        self.reasons[str(error)] += 1
+        if len(self.first_rejects) < self.keep_rejects:
+            self.first_rejects.append((line_number, str(error)))
+
+    def summary(self):
+        lines = [f"{self.rows} rows read, {self.imported} imported, {self.rejected} rejected "
+                 f"in {self.seconds:.2f} s ({self.rows_per_second:,.0f} rows/s, {self.batches} batches)"]
+        for reason, count in self.reasons.most_common():
+            lines.append(f"  {count:>8}  {reason}")
+        for line_number, error in self.first_rejects:
+            lines.append(f"  line {line_number}: {error}")
+        return "\n".join(lines)
+
+
+def import_products(repository, rows, batch_size=5000, rejects=None, progress=None):
+    """Validate and upsert (line number, row) pairs in batches, returns an ImportReport
+
+    rejects, if given, is a text file each rejected row is written to as JSONL.
+    progress, if given, is called with the report after every batch.
+    """
+    report = ImportReport()
+    batch = []
+
+    def reject(line_number, error, raw):
+        report.reject(line_number, error)
+        if rejects is not None:
+            rejects.write(json.dumps({"line": line_number, "error": str(error),
+                                      "row": raw if isinstance(raw, dict) else None},
+                                     ensure_ascii=False, default=str) + "\n")
+
+    def flush():
+        try:
+            repository.upsert_many([product for _, product in batch], publish=False)
+            report.imported += len(batch)
+        except (sqlite3.Error, OverflowError, ValueError):
+            # Something validation let through - retry row by row so only the bad rows are lost
+            for line_number, product in batch:
+                try:
+                    repository.upsert_many([product], publish=False)
+                    report.imported += 1
+                except (sqlite3.Error, OverflowError, ValueError) as error:
+                    reject(line_number, RowError(f"rejected by the database: {error}"), product)
+        report.batches += 1
+        batch.clear()
+        report.seconds = time.perf_counter() - report.started
+        if progress is not None:
+            progress(report)
+
+    try:
+        for line_number, raw in rows:
+            report.rows += 1
+            try:
+                if isinstance(raw, RowError):
+                    raise raw
+                batch.append((line_number, validate_product(raw)))
+            except RowError as error:
+                reject(line_number, error, raw)
+                continue
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    finally:
+        # Publish whatever was written, even if reading the feed failed part way
+        if report.imported:
+            repository.publish()
+    report.seconds = time.perf_counter() - report.started
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a CSV or JSONL product feed into the VibeCart catalog")
+    parser.add_argument("feed", help="CSV or JSONL file, optionally .gz")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="default: from the file extension")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database path")
+    parser.add_argument("--batch-size", type=int, default=5000, help="rows per transaction")
+    parser.add_argument("--rejects", help="write rejected rows to this JSONL file")
+    parser.add_argument("--quiet", action="store_true", help="no progress lines")
+    args = parser.parse_args()
+
+    def progress(report):
+        if report.batches % 20 == 0:
+            print(f"  {report.rows:,} rows, {report.rows_per_second:,.0f} rows/s", flush=True)
+
+    repository = open_catalog(args.db)
+    rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+    try:
+        report = import_products(repository, read_feed(args.feed, args.format), args.batch_size,
+                                 rejects=rejects, progress=None if args.quiet else progress)
+    finally:
+        if rejects is not None:
+            rejects.close()
+        repository.pool.close()
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
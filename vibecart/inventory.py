@@ -0,0 +1,75 @@
+"""
+Inventory - atomic stock reservation shared by every session in the process.
+
+Stock lives in the catalog's products table. A checkout decrements every cart
+line with a conditional UPDATE inside one BEGIN IMMEDIATE transaction, so two
+sessions can never both take the last unit: the second UPDATE matches no row
+and the whole reservation rolls back.
+"""
+
+from vibecart.catalog_db import rollback
+
+
+class OutOfStock(Exception):
+    """Raised when a reservation can't be met - shortages maps product id to units available"""
+
+    def __init__(self, shortages):
+        super().__init__(f"insufficient stock for products {sorted(shortages)}")
+        self.shortages = shortages
+
+
+class Inventory:
+    """Stock levels and all-or-nothing reservations on a CatalogRepository"""
+
+    def __init__(self, repository):
+        self.pool = repository.pool
+
+    def available(self, product_id):
+        """Units in stock, 0 for unknown products"""
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT stock FROM products WHERE id = ?", (product_id,)).fetchone()
+        return row[0] if row else 0
+
+    def available_many(self, product_ids):
+        """Units in stock per product id, skipping unknown ids"""
+        product_ids = list(product_ids)
+        if not product_ids:
+            return {}
+        marks = ", ".join("?" * len(product_ids))
+        with self.pool.connection() as conn:
+            return dict(conn.execute(f"SELECT id, stock FROM products WHERE id IN ({marks})", product_ids))
+
+    def reserve(self, lines):
+        """Take quantity units of every product in lines ({product_id: quantity}), or none at all
+
+        Raises OutOfStock listing every line that couldn't be met.
+        """
+        shortages = {}
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Fixed id order keeps lock acquisition deterministic
+                for product_id, quantity in sorted(lines.items()):
+                    updated = conn.execute(
+                        "UPDATE products SET stock = stock - ? WHERE id = ? AND stock >= ?",
+                        (quantity, product_id, quantity),
+                    ).rowcount
+                    if not updated:
+                        row = conn.execute("SELECT stock FROM products WHERE id = ?", (product_id,)).fetchone()
+                        shortages[product_id] = row[0] if row else 0
+                if not shortages:
+                    conn.execute("COMMIT")
+            except BaseException:
+                # Also covers a failed COMMIT, which would otherwise leave the
+                # decrements pending on a connection going back to the pool
+                rollback(conn)
+                raise
+            if shortages:
+                conn.execute("ROLLBACK")
+                raise OutOfStock(shortages)
+
+    def release(self, lines):
+        """Put reserved units back, e.g. when the order couldn't be recorded"""
+        with self.pool.transaction() as conn:
+            conn.executemany("UPDATE products SET stock = stock + ? WHERE id = ?",
+                             [(quantity, product_id) for product_id, quantity in sorted(lines.items())])
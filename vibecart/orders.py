@@ -0,0 +1,200 @@
+"""
+Durable order log - SQLite in WAL mode with group commit.
+
+Checkouts hand their order to a single writer thread and wait. The writer
+drains everything queued at that moment into one transaction, so a burst of
+concurrent checkouts shares one fsync instead of paying for one each.
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+
+from vibecart.catalog_db import ConnectionPool
+
+DEFAULT_ORDERS_DB_PATH = os.environ.get("VIBECART_ORDERS_DB", os.path.join("data", "orders.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    order_id TEXT PRIMARY KEY,
+    customer_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    total REAL NOT NULL,
+    item_count INTEGER NOT NULL,
+    items TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_orders_customer ON orders (customer_id, created_at, order_id);
+CREATE INDEX IF NOT EXISTS idx_orders_created ON orders (created_at, order_id);
+"""
+
+_STOP = object()
+
+
+def encode_cursor(order):
+    """Opaque keyset cursor pointing just past an order"""
+    return f"{order['created_at']!r}|{order['order_id']}"
+
+
+def decode_cursor(cursor):
+    created_at, order_id = cursor.split("|", 1)
+    return float(created_at), order_id
+
+
+def row_to_order(row):
+    """Turn an orders row into an order dict"""
+    return {
+        "order_id": row[0],
+        "customer_id": row[1],
+        "created_at": row[2],
+        "total": row[3],
+        "item_count": row[4],
+        "items": {int(pid): qty for pid, qty in json.loads(row[5]).items()},
+    }
+
+
+def order_to_row(order):
+    """Turn an order dict into an orders row"""
+    return (order["order_id"], order["customer_id"], order["created_at"], order["total"],
+            sum(order["items"].values()), json.dumps(order["items"]))
+
+
+class OrderStore:
+    """Append-only order table with a group-committing writer thread"""
+
+    def __init__(self, path, max_batch=512, pool_size=2):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_batch = max_batch
+        self.commits = 0
+        self.orders_written = 0
+        self._queue = queue.Queue()
+
+        self._writer = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=FULL")
+        self._writer.executescript(SCHEMA)
+        self.pool = ConnectionPool(path, pool_size)
+
+        self._thread = threading.Thread(target=self._run, name="order-writer", daemon=True)
+        self._thread.start()
+
+    def append(self, order, timeout=30):
+        """Persist an order, returning once it is durable on disk"""
+        return self.submit(order).result(timeout)
+
+    def submit(self, order):
+        """Queue an order for the next group commit, returns a Future"""
+        future = Future()
+        self._queue.put((order, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # Everything that queued up while the previous commit was syncing
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is _STOP for item in batch)
+            batch = [item for item in batch if item is not _STOP]
+            if batch:
+                try:
+                    self._commit(batch)
+                except Exception as error:
+                    # Never let one batch take the writer down - fail it and keep going
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(error)
+            if stop:
+                return
+
+    def _commit(self, batch):
+        rows, valid = [], []
+        for order, future in batch:
+            try:
+                rows.append(order_to_row(order))
+            except Exception as error:
+                # A malformed order fails alone, before the transaction starts
+                future.set_exception(error)
+                continue
+            valid.append((order, future))
+        batch = valid
+        if not batch:
+            return
+        try:
+            self._writer.execute("BEGIN IMMEDIATE")
+            self._writer.executemany("INSERT INTO orders VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._writer.execute("COMMIT")
+        except Exception as error:
+            if self._writer.in_transaction:
+                self._writer.execute("ROLLBACK")
+            if len(batch) > 1:
+                # Find the bad order(s) without failing the rest of the group
+                for item in batch:
+                    self._commit([item])
+                return
+            batch[0][1].set_exception(error)
+            return
+        self.commits += 1
+        self.orders_written += len(batch)
+        for order, future in batch:
+            future.set_result(order)
+
+    def history(self, customer_id=None, cursor=None, limit=10):
+        """One page of orders, newest first, and the cursor for the next page (or None)"""
+        clauses, params = [], []
+        if customer_id is not None:
+            clauses.append("customer_id = ?")
+            params.append(customer_id)
+        if cursor:
+            clauses.append("(created_at, order_id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        sql = (f"SELECT order_id, customer_id, created_at, total, item_count, items FROM orders{where}"
+               " ORDER BY created_at DESC, order_id DESC LIMIT ?")
+        with self.pool.connection() as conn:
+            orders = [row_to_order(row) for row in conn.execute(sql, params + [limit + 1])]
+        next_cursor = encode_cursor(orders[limit - 1]) if len(orders) > limit else None
+        return orders[:limit], next_cursor
+
+    def items_since(self, rowid=0):
+        """(rowid, items) for every order appended after rowid, in log order"""
+        with self.pool.connection() as conn:
+            rows = conn.execute("SELECT rowid, items FROM orders WHERE rowid > ? ORDER BY rowid", (rowid,)).fetchall()
+        return [(rowid, {int(pid): qty for pid, qty in json.loads(items).items()}) for rowid, items in rows]
+
+    def scan(self, batch_size=1000):
+        """Yield every order in log order, reading batch_size rows per query"""
+        last_rowid = 0
+        while True:
+            # Borrow a connection per batch so a slow consumer never pins one
+            with self.pool.connection() as conn:
+                rows = conn.execute(
+                    "SELECT rowid, order_id, customer_id, created_at, total, item_count, items FROM orders"
+                    " WHERE rowid > ? ORDER BY rowid LIMIT ?", (last_rowid, batch_size)).fetchall()
+            for row in rows:
+                yield row_to_order(row[1:])
+            if len(rows) < batch_size:
+                return
+            last_rowid = rows[-1][0]
+
+    def count(self, customer_id=None):
+        """Number of stored orders"""
+        with self.pool.connection() as conn:
+            if customer_id is None:
+                return conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM orders WHERE customer_id = ?", (customer_id,)).fetchone()[0]
+
+    def close(self):
+        """Flush queued orders and stop the writer"""
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._writer.close()
+        self.pool.close()
@@ -0,0 +1,92 @@
+"""
+Pricing engine - promo rules, shipping and tax in integer cents.
+
+Promo rules are declared as data and compiled once into discount functions,
+so quoting a cart is a pass over its lines with no rule parsing or float math.
+"""
+
+from collections import namedtuple
+
+from vibecart.cart import to_cents
+from vibecart.search import tokenize
+
+PromoRule = namedtuple("PromoRule", "code description percent_off amount_off_cents min_subtotal_cents item_words")
+PromoRule.__new__.__defaults__ = (0, 0, 0, None)
+
+Quote = namedtuple("Quote", "subtotal_cents discount_cents shipping_cents tax_cents total_cents promo_code promo_error")
+
+# Words in a product's name or tags that make it one of the "colorful items"
+COLORFUL_WORDS = frozenset({"rainbow", "neon", "gradient", "multicolor", "color", "colorful",
+                            "tie", "dye", "rgb", "pastel", "vibrant"})
+
+PROMO_RULES = [
+    PromoRule("VIBECART20", "20% off all orders", percent_off=20),
+    PromoRule("COLORME50", "$50 off orders over $200", amount_off_cents=5000, min_subtotal_cents=20000),
+    PromoRule("RAINBOW10", "10% off colorful items", percent_off=10, item_words=COLORFUL_WORDS),
+]
+
+
+def percent_of(cents, percent):
+    """Percentage of an amount in cents, rounded half up"""
+    return (cents * percent + 50) // 100
+
+
+def compile_rule(rule):
+    """Discount function (lines, subtotal_cents) -> discount cents for a rule
+
+    lines are (product, quantity, line_cents) tuples.
+    """
+    def item_matches(product):
+        words = set(tokenize(product["name"])) | {word for tag in product.get("tags", ()) for word in tokenize(tag)}
+        return not words.isdisjoint(rule.item_words)
+
+    def discount(lines, subtotal_cents):
+        if subtotal_cents < rule.min_subtotal_cents:
+            return 0
+        eligible = subtotal_cents
+        if rule.item_words is not None:
+            eligible = sum(line_cents for product, _, line_cents in lines if item_matches(product))
+        return min(eligible, percent_of(eligible, rule.percent_off) + rule.amount_off_cents)
+
+    return discount
+
+
+class PricingEngine:
+    """Quotes carts against a fixed set of promo rules"""
+
+    def __init__(self, rules=PROMO_RULES, free_shipping_cents=10000, shipping_cents=999, tax_percent=8):
+        self.rules = {rule.code: rule for rule in rules}
+        self._discounts = {rule.code: compile_rule(rule) for rule in rules}
+        self.free_shipping_cents = free_shipping_cents
+        self.shipping_cents = shipping_cents
+        self.tax_percent = tax_percent
+
+    def quote(self, quantities, products, promo_code=None):
+        """Quote for {product_id: quantity} at current catalog prices
+
+        products are the catalog entries for the cart lines. Unknown promo
+        codes or unmet conditions leave the price unchanged and set promo_error.
+        """
+        by_id = {product["id"]: product for product in products}
+        lines = [
+            (by_id[product_id], quantity, to_cents(by_id[product_id]["price"]) * quantity)
+            for product_id, quantity in quantities.items() if product_id in by_id
+        ]
+        subtotal = sum(line_cents for _, _, line_cents in lines)
+
+        discount, promo_error = 0, None
+        if promo_code:
+            promo_code = promo_code.strip().upper()
+            rule = self.rules.get(promo_code)
+            if rule is None:
+                promo_error = f"{promo_code} isn't a valid code"
+            else:
+                discount = self._discounts[promo_code](lines, subtotal)
+                if not discount and lines:
+                    promo_error = f"{promo_code} doesn't apply to this cart ({rule.description})"
+
+        discounted = subtotal - discount
+        shipping = 0 if not lines or discounted >= self.free_shipping_cents else self.shipping_cents
+        tax = percent_of(discounted, self.tax_percent)
+        return Quote(subtotal, discount, shipping, tax, discounted + shipping + tax,
+                     promo_code if discount else None, promo_error)
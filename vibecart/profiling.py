@@ -0,0 +1,128 @@
+"""
+Hot-path profiling - per-function latency histograms for the whole process.
+
+Functions wrapped with Profiler.timed() (or blocks inside Profiler.section())
+add their wall time to a log-bucketed histogram. Switched off, the wrapper
+costs one attribute check per call, so it can stay on the production paths;
+set VIBECART_PROFILE=1 to start with it on, or flip Profiler.enabled at runtime.
+"""
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Bucket upper bounds from 1 us to ~70 s, four buckets per doubling (~19% wide)
+BUCKET_BOUNDS = [1e-6 * 2 ** (step / 4) for step in range(104)]
+
+
+class Histogram:
+    """Fixed log-scale latency histogram"""
+
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th quantile, in seconds"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return BUCKET_BOUNDS[min(index, len(BUCKET_BOUNDS) - 1)]
+        return BUCKET_BOUNDS[-1]
+
+
+class Profiler:
+    """Named histograms plus a full-script run counter, shared by every session"""
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get("VIBECART_PROFILE") == "1"
+        self.enabled = enabled
+        self.script_runs = 0
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.add(seconds)
+
+    def script_run(self):
+        """Count one full script run, the denominator for calls per script run
+
+        Fragment reruns don't go through the script body and aren't counted, so
+        calls made from fragments can exceed one per script run.
+        """
+        if self.enabled:
+            self.script_runs += 1
+
+    def timed(self, name=None):
+        """Decorator timing every call of a function"""
+        def decorate(fn):
+            label = name or fn.__name__
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.record(label, time.perf_counter() - start)
+
+            return wrapper
+
+        return decorate
+
+    @contextmanager
+    def section(self, name):
+        """Time a block"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def stats(self):
+        """Per-name call count, calls per full script run, mean, p50, p95 and p99 in ms - slowest total first"""
+        with self._lock:
+            histograms = sorted(self._histograms.items(), key=lambda item: -item[1].total)
+            return [
+                {
+                    "name": name,
+                    "calls": histogram.count,
+                    "per_script_run": round(histogram.count / self.script_runs, 2) if self.script_runs else None,
+                    "mean_ms": round(histogram.total / histogram.count * 1e3, 3),
+                    "p50_ms": round(histogram.quantile(0.50) * 1e3, 3),
+                    "p95_ms": round(histogram.quantile(0.95) * 1e3, 3),
+                    "p99_ms": round(histogram.quantile(0.99) * 1e3, 3),
+                    "total_ms": round(histogram.total * 1e3, 1),
+                }
+                for name, histogram in histograms
+            ]
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.script_runs = 0
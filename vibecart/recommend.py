@@ -0,0 +1,110 @@
+"""
+Item-to-item recommendations - top-k neighbours per product.
+
+A product's neighbours score on catalog attributes (same category, shared
+tags, rating) plus how often they were bought in the same order. Scores for
+one product are a few vectorised passes over the columnar view; the top k are
+memoised, so serving is a lookup per viewed item. New orders are read from
+the order log past a watermark and only invalidate the products they contain.
+"""
+
+import threading
+from collections import Counter, defaultdict
+
+import numpy as np
+
+CATEGORY_WEIGHT = 1.0
+SHARED_TAG_WEIGHT = 0.25
+RATING_WEIGHT = 0.1
+CO_PURCHASE_WEIGHT = 2.0
+
+
+class Recommender:
+    """Top-k similar products over a ColumnarCatalog and its FacetIndex, refreshed from an OrderStore"""
+
+    def __init__(self, columns, facets, k=8):
+        self.columns = columns
+        self.k = k
+        # Tag -> rows postings: memory grows with tag occurrences, not products x distinct tags
+        self._tag_rows = facets.tag_rows
+        self._base_scores = RATING_WEIGHT * columns.ratings
+
+        self._co_purchases = defaultdict(Counter)
+        self._neighbours = {}
+        self._watermark = 0
+        self._lock = threading.Lock()
+
+    def neighbours(self, product_id):
+        """Up to k product ids most similar to product_id, best first"""
+        cached = self._neighbours.get(product_id)
+        if cached is not None:
+            return cached
+        # Misses score under the lock refresh() holds, so co-purchase counts don't
+        # change mid-read and a list computed before an invalidation is never stored
+        with self._lock:
+            cached = self._neighbours.get(product_id)
+            if cached is not None:
+                return cached
+            return self._score(product_id)
+
+    def _score(self, product_id):
+        """Score, rank and memoise one product's neighbours - caller holds the lock"""
+        row = self.columns.rows_of([product_id])[0]
+        if row < 0:
+            return []
+
+        scores = self._base_scores.copy()
+        scores += CATEGORY_WEIGHT * (self.columns.category_codes == self.columns.category_codes[row])
+        for tag in set(self.columns.tags[row]):
+            scores[self._tag_rows[tag]] += SHARED_TAG_WEIGHT
+        bought_with = self._co_purchases.get(product_id)
+        if bought_with:
+            rows = self.columns.rows_of(bought_with.keys())
+            counts = np.fromiter(bought_with.values(), dtype=np.float64)
+            known = rows >= 0
+            scores[rows[known]] += CO_PURCHASE_WEIGHT * counts[known]
+        scores[row] = -np.inf
+
+        k = min(self.k, self.columns.size - 1)
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+        neighbours = self.columns.ids_of(top)
+        self._neighbours[product_id] = neighbours
+        return neighbours
+
+    def record_order(self, items):
+        """Count every pair of products bought together and drop their stale neighbours"""
+        with self._lock:
+            self._record_order(items)
+
+    def _record_order(self, items):
+        product_ids = list(items)
+        for product_id in product_ids:
+            counts = self._co_purchases[product_id]
+            for other_id in product_ids:
+                if other_id != product_id:
+                    counts[other_id] += 1
+            self._neighbours.pop(product_id, None)
+
+    def refresh(self, order_store):
+        """Fold in orders logged since the last refresh, from any server process"""
+        with self._lock:
+            for rowid, items in order_store.items_since(self._watermark):
+                self._record_order(items)
+                self._watermark = rowid
+
+    def recommend(self, product_ids, limit=8, exclude=()):
+        """Neighbours of several products interleaved, without repeats or the products themselves"""
+        seen = set(product_ids) | set(exclude)
+        lists = [self.neighbours(product_id) for product_id in product_ids]
+        recommended = []
+        for rank in range(self.k):
+            for neighbours in lists:
+                if rank < len(neighbours) and neighbours[rank] not in seen:
+                    seen.add(neighbours[rank])
+                    recommended.append(neighbours[rank])
+                    if len(recommended) == limit:
+                        return recommended
+        return recommended
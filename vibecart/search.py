@@ -0,0 +1,116 @@
+"""
+Full-text product search - an in-memory inverted index ranked with BM25.
+
+Each posting stores its precomputed BM25 impact (idf times the saturated,
+length-normalised term frequency), so a query is a handful of NumPy
+scatter-adds over the matching documents rather than a per-document loop.
+"""
+
+import bisect
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# How much one occurrence counts in each field (BM25F-style weighting)
+FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "category": 2.0, "description": 1.0}
+
+# Most vocabulary terms a trailing prefix may expand to
+MAX_PREFIX_TERMS = 64
+
+
+def tokenize(text):
+    """Lower-case alphanumeric tokens"""
+    return _TOKEN.findall(text.lower())
+
+
+def product_terms(product):
+    """Weighted term frequencies across the searchable fields"""
+    counts = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        value = product.get(field, "")
+        if isinstance(value, (list, tuple)):
+            value = " ".join(value)
+        for token in tokenize(value):
+            counts[token] += weight
+    return counts
+
+
+class SearchIndex:
+    """Inverted index over name, description, tags and category"""
+
+    def __init__(self, products, k1=1.2, b=0.75):
+        self.product_ids = np.array([p["id"] for p in products], dtype=np.int64)
+        doc_terms = [product_terms(p) for p in products]
+        lengths = np.array([sum(terms.values()) for terms in doc_terms], dtype=np.float64)
+        avg_length = lengths.mean() if len(lengths) else 1.0
+        norms = k1 * (1 - b + b * lengths / avg_length)
+
+        postings = defaultdict(lambda: ([], []))
+        for doc, terms in enumerate(doc_terms):
+            for term, tf in terms.items():
+                docs, tfs = postings[term]
+                docs.append(doc)
+                tfs.append(tf)
+
+        doc_count = len(products)
+        self._postings = {}
+        for term, (docs, tfs) in postings.items():
+            docs = np.array(docs, dtype=np.int32)
+            tfs = np.array(tfs, dtype=np.float64)
+            idf = np.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            impacts = idf * tfs * (k1 + 1) / (tfs + norms[docs])
+            self._postings[term] = (docs, impacts.astype(np.float32))
+        self._vocabulary = sorted(self._postings)
+
+    def __len__(self):
+        return len(self.product_ids)
+
+    def expand(self, prefix):
+        """Vocabulary terms starting with prefix"""
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_PREFIX_TERMS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query, limit=None, prefix=True):
+        """Product ids matching every query term, best first
+
+        With prefix=True the last term also matches longer words, so partial
+        input while typing already finds results.
+        """
+        tokens = tokenize(query)
+        if not tokens or not len(self):
+            return []
+
+        scores = np.zeros(len(self), dtype=np.float32)
+        matched = np.zeros(len(self), dtype=np.int16)
+        for position, token in enumerate(tokens):
+            is_last = position == len(tokens) - 1
+            terms = self.expand(token) if prefix and is_last else [token]
+            terms = [term for term in terms if term in self._postings]
+            if not terms:
+                return []
+            if len(terms) == 1:
+                docs, impacts = self._postings[terms[0]]
+                scores[docs] += impacts
+                matched[docs] += 1
+                continue
+            # Several expansions of one prefix: a document scores its best one
+            best = np.zeros(len(self), dtype=np.float32)
+            for term in terms:
+                docs, impacts = self._postings[term]
+                best[docs] = np.maximum(best[docs], impacts)
+            scores += best
+            matched += best > 0
+
+        hits = np.flatnonzero(matched == len(tokens))
+        if limit is not None and len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        order = hits[np.argsort(-scores[hits], kind="stable")]
+        return self.product_ids[order].tolist()
@@ -0,0 +1,213 @@
+"""
+Seed the SQLite catalog with the demo products.
+
+    python -m vibecart.seed [--db data/vibecart.db] [--force]
+"""
+
+import argparse
+import os
+import random
+
+from vibecart.catalog_db import CatalogRepository
+
+DEFAULT_DB_PATH = os.environ.get("VIBECART_DB", os.path.join("data", "vibecart.db"))
+
+# Theme colors used for product image placeholders
+IMAGE_COLORS = ["#FF6B6B", "#4ECDC4", "#FFD166", "#06D6A0", "#118AB2",
+                "#EF476F", "#073B4C", "#F8F9FA", "#9B5DE5", "#F8961E"]
+
+# Enhanced Product Data with More Items
+DEMO_PRODUCTS = [
+    {
+        "id": 1,
+        "name": "🌈 Rainbow Sneakers",
+        "price": 89.99,
+        "category": "Footwear",
+        "emoji": "👟",
+        "description": "Vibrant colorful sneakers with rainbow gradient design",
+        "rating": 4.7,
+        "stock": 15,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": True,
+        "original_price": 119.99,
+        "tags": ["Trending", "Limited"]
+    },
+    {
+        "id": 2,
+        "name": "🎧 Neon Wireless Headphones",
+        "price": 149.99,
+        "category": "Electronics",
+        "emoji": "🎧",
+        "description": "RGB LED headphones with neon glow and 40hr battery",
+        "rating": 4.9,
+        "stock": 8,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": False,
+        "tags": ["Bestseller", "New"]
+    },
+    {
+        "id": 3,
+        "name": "👕 Tie-Dye Collection T-Shirt",
+        "price": 29.99,
+        "category": "Clothing",
+        "emoji": "👕",
+        "description": "Organic cotton tie-dye t-shirt in psychedelic colors",
+        "rating": 4.5,
+        "stock": 25,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": True,
+        "original_price": 39.99,
+        "tags": ["Eco-Friendly"]
+    },
+    {
+        "id": 4,
+        "name": "⌚ Gradient Smart Watch",
+        "price": 329.99,
+        "category": "Electronics",
+        "emoji": "⌚",
+        "description": "Color-changing display with animated watch faces",
+        "rating": 4.8,
+        "stock": 5,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": False,
+        "tags": ["Premium", "Smart"]
+    },
+    {
+        "id": 5,
+        "name": "🎒 Multicolor Backpack",
+        "price": 99.99,
+        "category": "Accessories",
+        "emoji": "🎒",
+        "description": "Waterproof backpack with color-changing panels",
+        "rating": 4.6,
+        "stock": 12,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": True,
+        "original_price": 139.99,
+        "tags": ["Waterproof"]
+    },
+    {
+        "id": 6,
+        "name": "🧘 Rainbow Yoga Mat",
+        "price": 49.99,
+        "category": "Fitness",
+        "emoji": "🧘",
+        "description": "Non-slip yoga mat with mandala rainbow pattern",
+        "rating": 4.4,
+        "stock": 20,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": False,
+        "tags": ["Fitness"]
+    },
+    {
+        "id": 7,
+        "name": "☕ Color-Changing Mug",
+        "price": 19.99,
+        "category": "Home",
+        "emoji": "☕",
+        "description": "Mug that reveals colors with hot liquid",
+        "rating": 4.7,
+        "stock": 30,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": True,
+        "original_price": 29.99,
+        "tags": ["Magic", "Fun"]
+    },
+    {
+        "id": 8,
+        "name": "🖱️ RGB Gaming Mouse",
+        "price": 69.99,
+        "category": "Electronics",
+        "emoji": "🖱️",
+        "description": "16.8 million color RGB gaming mouse",
+        "rating": 4.9,
+        "stock": 7,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": False,
+        "tags": ["Gaming", "RGB"]
+    },
+    {
+        "id": 9,
+        "name": "🕶️ Gradient Sunglasses",
+        "price": 45.99,
+        "category": "Accessories",
+        "emoji": "🕶️",
+        "description": "Color gradient lenses with UV protection",
+        "rating": 4.3,
+        "stock": 18,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": True,
+        "original_price": 59.99,
+        "tags": ["Summer", "Style"]
+    },
+    {
+        "id": 10,
+        "name": "📱 Pastel Phone Case",
+        "price": 24.99,
+        "category": "Accessories",
+        "emoji": "📱",
+        "description": "Soft pastel colors with glitter accents",
+        "rating": 4.6,
+        "stock": 22,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": False,
+        "tags": ["Pastel", "Cute"]
+    },
+    {
+        "id": 11,
+        "name": "💄 Neon Lipstick Set",
+        "price": 34.99,
+        "category": "Beauty",
+        "emoji": "💄",
+        "description": "Vibrant neon lip colors for bold looks",
+        "rating": 4.8,
+        "stock": 14,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": True,
+        "original_price": 49.99,
+        "tags": ["Beauty", "Vibrant"]
+    },
+    {
+        "id": 12,
+        "name": "🎨 Artist's Brush Set",
+        "price": 39.99,
+        "category": "Art",
+        "emoji": "🎨",
+        "description": "Colorful brush set with rainbow handles",
+        "rating": 4.9,
+        "stock": 9,
+        "image_color": random.choice(IMAGE_COLORS),
+        "on_sale": False,
+        "tags": ["Art", "Creative"]
+    }
+]
+
+
+def open_catalog(path=DEFAULT_DB_PATH):
+    """Open the catalog database, creating its directory if needed"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return CatalogRepository(path)
+
+
+def seed(repository, force=False):
+    """Load the demo products unless the catalog already has products"""
+    if len(repository) and not force:
+        return 0
+    repository.upsert_many(DEMO_PRODUCTS)
+    return len(DEMO_PRODUCTS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the VibeCart catalog with the demo products")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database path")
+    parser.add_argument("--force", action="store_true", help="upsert even if the catalog is not empty")
+    args = parser.parse_args()
+
+    loaded = seed(open_catalog(args.db), force=args.force)
+    print(f"Seeded {loaded} products into {args.db}" if loaded else f"{args.db} already has products, use --force")
+
+
+if __name__ == "__main__":
+    main()
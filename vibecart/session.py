@@ -0,0 +1,122 @@
+"""
+Compact per-session state and a memory footprint diagnostic.
+
+Every open browser tab keeps its own session state in the one server process,
+so the per-session containers here trade hash tables for sorted arrays and
+deep_sizeof() measures what a session actually costs.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+
+# Budget a session's state should stay under - the diagnostic flags the rest
+SESSION_BYTES_BUDGET = 64 * 1024
+
+
+class Wishlist:
+    """Set of product ids stored as one sorted array"""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, product_ids=()):
+        self._ids = array("q", sorted(set(product_ids)))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __bool__(self):
+        return bool(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __contains__(self, product_id):
+        index = bisect_left(self._ids, product_id)
+        return index < len(self._ids) and self._ids[index] == product_id
+
+    def add(self, product_id):
+        """Add a product id if absent"""
+        index = bisect_left(self._ids, product_id)
+        if index == len(self._ids) or self._ids[index] != product_id:
+            self._ids.insert(index, product_id)
+
+    def remove(self, product_id):
+        """Remove a product id, KeyError if absent"""
+        index = bisect_left(self._ids, product_id)
+        if index == len(self._ids) or self._ids[index] != product_id:
+            raise KeyError(product_id)
+        del self._ids[index]
+
+    def discard(self, product_id):
+        """Remove a product id if present"""
+        if product_id in self:
+            self.remove(product_id)
+
+
+class RecentlyViewed:
+    """Most recently viewed product ids, oldest first, capped at max_items - O(1) per view"""
+
+    __slots__ = ("max_items", "_ids")
+
+    def __init__(self, max_items=5):
+        self.max_items = max_items
+        self._ids = OrderedDict()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __bool__(self):
+        return bool(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __reversed__(self):
+        return reversed(self._ids)
+
+    def __contains__(self, product_id):
+        return product_id in self._ids
+
+    def touch(self, product_id):
+        """Mark a product as just viewed, evicting the oldest beyond max_items"""
+        self._ids[product_id] = None
+        self._ids.move_to_end(product_id)
+        if len(self._ids) > self.max_items:
+            self._ids.popitem(last=False)
+
+
+def deep_sizeof(obj, seen=None):
+    """Bytes held by obj and everything it references, each object counted once"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif isinstance(obj, (str, bytes, bytearray, array, int, float, bool)) or obj is None:
+        pass
+    else:
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                size += deep_sizeof(getattr(obj, slot), seen)
+        if hasattr(obj, "__dict__"):
+            size += deep_sizeof(vars(obj), seen)
+    return size
+
+
+def session_footprint(states):
+    """Per-session and total bytes for a list of session state mappings"""
+    sizes = sorted((deep_sizeof(dict(state)) for state in states), reverse=True)
+    return {
+        "sessions": len(sizes),
+        "total_bytes": sum(sizes),
+        "mean_bytes": sum(sizes) // len(sizes) if sizes else 0,
+        "max_bytes": sizes[0] if sizes else 0,
+        "over_budget": sum(size > SESSION_BYTES_BUDGET for size in sizes),
+    }